@@ -29,6 +29,7 @@ Endpoints:
     GET  /                    -> Dashboard UI
     GET  /health              -> Health check
     WS   /ws                  -> WebSocket for real-time updates
+    WS   /ws/status           -> Merged status frames, pushed only on change
 
     GET  /api/status          -> Full system status
     GET  /api/orchestrator    -> Orchestrator status
@@ -46,10 +47,16 @@ Usage:
 """
 
 import asyncio
+import functools
+import gzip
+import hashlib
 import json
+import os
 import subprocess
 import sys
 import threading
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
@@ -62,7 +69,7 @@ sys.path.insert(0, str(WORKSPACE_ROOT))
 
 try:
     from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse as _StdJSONResponse
     from fastapi.middleware.cors import CORSMiddleware
     from starlette.middleware.base import BaseHTTPMiddleware
     from starlette.responses import Response
@@ -71,12 +78,124 @@ except ImportError:
     print("[!] Missing dependencies. Run: pip install fastapi uvicorn websockets")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+def dumps_json(value: Any) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder copes
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class JSONResponse(_StdJSONResponse):
+    """JSONResponse rendered through dumps_json (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
 # ─── App Configuration ────────────────────────────────────────────────────────
 
+def get_orchestrator():
+    """Return the shared SlateOrchestrator, creating it on first use."""
+    orch = getattr(app.state, "orchestrator", None)
+    if orch is None:
+        from slate.slate_orchestrator import SlateOrchestrator
+        orch = app.state.orchestrator = SlateOrchestrator()
+    return orch
+
+def get_runner_manager():
+    """Return the shared SlateRunnerManager, creating it on first use."""
+    mgr = getattr(app.state, "runner_mgr", None)
+    if mgr is None:
+        from slate.slate_runner_manager import SlateRunnerManager
+        mgr = app.state.runner_mgr = SlateRunnerManager()
+    return mgr
+
+GITHUB_REPO = "SynchronizedLivingArchitecture/S.L.A.T.E"
+GH_CLI_TIMEOUT = float(os.environ.get("GH_CLI_TIMEOUT", "10"))  # seconds per gh call
+
+def _github_token() -> str | None:
+    """Read a GitHub token from the environment or, failing that, the gh CLI."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            [get_gh_cli(), "auth", "token"],
+            capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return None
+
+def _create_github_client():
+    """Build a pooled client for the GitHub REST API, or None without a token."""
+    if httpx is None:
+        return None
+    token = _github_token()
+    if not token:
+        return None
+    return httpx.AsyncClient(
+        base_url="https://api.github.com",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+def get_github_client():
+    """Return the shared GitHub API client, or None to fall back to the gh CLI.
+
+    Only created in the lifespan hook: the client's pooled connections belong
+    to the event loop that serves requests.
+    """
+    return getattr(app.state, "gh", None)
+
+def _import_status_module():
+    """Import slate_status so the first /api/status skips the module load."""
+    import slate.slate_status  # noqa: F401
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Import status modules and build long-lived managers before serving.
+
+    Keeps module import and constructor cost off the first request; the
+    getters above still build lazily if startup could not.
+    """
+    for warm in (_import_status_module, get_orchestrator, get_runner_manager):
+        try:
+            await asyncio.to_thread(warm)
+        except Exception as e:
+            print(f"[-] {warm.__name__} failed at startup: {e}")
+    app.state.gh = await asyncio.to_thread(_create_github_client)
+    try:
+        yield
+    finally:
+        if app.state.gh is not None:
+            await app.state.gh.aclose()
+            app.state.gh = None
+
 app = FastAPI(
     title="SLATE Dashboard",
     description="Agentic Workflow Management System",
-    version="2.4.0"
+    version="2.4.0",
+    lifespan=lifespan,
+    default_response_class=JSONResponse,
 )
 
 # CORS for local development and VSCode webviews
@@ -94,7 +213,7 @@ app.add_middleware(
 # NOTE: BaseHTTPMiddleware wraps responses and can block the event loop when
 # there are concurrent WebSocket connections. Using raw ASGI middleware instead.
 class VSCodeCompatMiddleware:
-    """Pure ASGI middleware that adds cache-control headers without blocking."""
+    """Pure ASGI middleware that adds no-cache headers unless a route set its own."""
 
     def __init__(self, app):
         self.app = app
@@ -109,9 +228,11 @@ class VSCodeCompatMiddleware:
             if message["type"] == "http.response.start":
                 headers = list(message.get("headers", []))
                 headers.append((b"x-content-type-options", b"nosniff"))
-                headers.append((b"cache-control", b"no-cache, no-store, must-revalidate"))
-                headers.append((b"pragma", b"no-cache"))
-                headers.append((b"expires", b"0"))
+                # Leave responses that set their own caching policy alone
+                if not any(k.lower() == b"cache-control" for k, _ in headers):
+                    headers.append((b"cache-control", b"no-cache, no-store, must-revalidate"))
+                    headers.append((b"pragma", b"no-cache"))
+                    headers.append((b"expires", b"0"))
                 message["headers"] = headers
             await send(message)
 
@@ -231,6 +352,83 @@ def save_tasks(tasks: List[Dict[str, Any]]):
     task_file = WORKSPACE_ROOT / "current_tasks.json"
     task_file.write_text(json.dumps(tasks, indent=2), encoding="utf-8")
 
+# ─── Stale-While-Revalidate Cache ─────────────────────────────────────────────
+# Expensive collectors (gh subprocess, runner detection) run at most once per
+# freshness window; stale hits are served instantly while a single background
+# task refreshes the entry.
+
+_swr_entries: Dict[str, tuple] = {}  # key -> (value, fresh_until, stale_until)
+_swr_bodies: Dict[str, tuple] = {}  # key -> (value, encoded JSON bytes)
+_swr_locks: Dict[str, asyncio.Lock] = {}
+_swr_tasks: set = set()
+
+def swr_cache(fresh: float, stale: float):
+    """Cache an async zero-argument collector with stale-while-revalidate semantics.
+
+    If a refresh fails, the last value is returned (dicts gain
+    ``"stale": True``) however old it is; only a cold cache raises.
+
+    The wrapper also gets a ``json_body()`` coroutine returning the cached
+    value as JSON bytes, encoded once per refresh rather than per request.
+
+    Args:
+        fresh: Seconds a value is served without revalidation.
+        stale: Seconds a value may still be served while refreshing in the background.
+    """
+    def decorator(fetch):
+        key = fetch.__name__
+        lock = _swr_locks.setdefault(key, asyncio.Lock())
+
+        async def refresh():
+            async with lock:
+                entry = _swr_entries.get(key)
+                if entry and time.monotonic() < entry[1]:
+                    return entry[0]  # refreshed by a concurrent caller
+                try:
+                    value = await fetch()
+                except Exception:
+                    if entry is None:
+                        raise
+                    # Past the stale window, but still more useful than an error
+                    last = entry[0]
+                    return {**last, "stale": True} if isinstance(last, dict) else last
+                now = time.monotonic()
+                _swr_entries[key] = (value, now + fresh, now + stale)
+                return value
+
+        async def refresh_quietly():
+            try:
+                await refresh()
+            except Exception:
+                pass  # keep serving the stale value
+
+        @functools.wraps(fetch)
+        async def wrapper():
+            entry = _swr_entries.get(key)
+            if entry:
+                value, fresh_until, stale_until = entry
+                now = time.monotonic()
+                if now < fresh_until:
+                    return value
+                if now < stale_until:
+                    if not lock.locked():
+                        task = asyncio.create_task(refresh_quietly())
+                        _swr_tasks.add(task)
+                        task.add_done_callback(_swr_tasks.discard)
+                    return value
+            return await refresh()
+
+        async def json_body() -> bytes:
+            value = await wrapper()
+            cached = _swr_bodies.get(key)
+            if cached is None or cached[0] is not value:
+                cached = _swr_bodies[key] = (value, dumps_json(value))
+            return cached[1]
+
+        wrapper.json_body = json_body
+        return wrapper
+    return decorator
+
 # ─── Health & Status Endpoints ────────────────────────────────────────────────
 
 @app.get("/health")
@@ -252,6 +450,152 @@ def api_status():
     except Exception as e:
         return JSONResponse(content={"error": str(e), "timestamp": datetime.now(timezone.utc).isoformat()})
 
+def _orchestrator_status() -> Dict[str, Any]:
+    """Collect orchestrator status (blocking — call from a worker thread)."""
+    return get_orchestrator().status(skip_dashboard_check=True)
+
+def _runner_status() -> Dict[str, Any]:
+    """Collect local runner detection plus GitHub runner state (blocking)."""
+    detection = get_runner_manager().detect()
+
+    # Add GitHub API runner status
+    try:
+        gh_cli = get_gh_cli()
+        result = subprocess.run(
+            [gh_cli, "api", f"repos/{GITHUB_REPO}/actions/runners",
+             "--jq", ".runners[0]"],
+            capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
+        )
+        if result.returncode == 0:
+            detection["github_runner"] = json.loads(result.stdout)
+    except Exception:
+        pass
+
+    return detection
+
+async def _workflow_runs() -> Dict[str, Any]:
+    """Collect recent GitHub workflow runs.
+
+    Prefers the shared REST client; without a token (or if the API call
+    fails) it falls back to the gh CLI.
+    """
+    client = get_github_client()
+    if client is not None:
+        try:
+            return await _workflow_runs_api(client)
+        except httpx.HTTPError:
+            pass
+    return await _workflow_runs_cli()
+
+async def _workflow_runs_api(client) -> Dict[str, Any]:
+    """Fetch workflow runs from the REST API in the gh CLI's JSON shape."""
+    resp = await client.get(f"/repos/{GITHUB_REPO}/actions/runs", params={"per_page": 15})
+    resp.raise_for_status()
+    runs = [
+        {
+            "name": run.get("name"),
+            "status": run.get("status"),
+            "conclusion": run.get("conclusion"),
+            "createdAt": run.get("created_at"),
+            "updatedAt": run.get("updated_at"),
+            "databaseId": run.get("id"),
+            "headBranch": run.get("head_branch"),
+            "event": run.get("event"),
+        }
+        for run in resp.json().get("workflow_runs", [])
+    ]
+    return {"runs": runs, "count": len(runs)}
+
+async def _run_gh_with_retry(args: List[str], *, attempts: int = 2,
+                             base_delay: float = 0.5) -> bytes:
+    """Run the gh CLI and return its stdout, retrying timeouts and failures.
+
+    Runs gh as an asyncio subprocess so the event loop keeps serving other
+    requests while it waits on the network. Each attempt is bounded by
+    GH_CLI_TIMEOUT; retries back off exponentially from ``base_delay``.
+    Raises the last error once all attempts are used up.
+    """
+    last_error: Exception = RuntimeError("gh was not run")
+    for attempt in range(attempts):
+        if attempt:
+            await asyncio.sleep(base_delay * 2 ** (attempt - 1))
+        proc = await asyncio.create_subprocess_exec(
+            get_gh_cli(), *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            cwd=str(WORKSPACE_ROOT)
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=GH_CLI_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            last_error = TimeoutError(f"gh {args[0]} timed out after {GH_CLI_TIMEOUT:g}s")
+            continue
+        if proc.returncode == 0:
+            return stdout
+        message = stderr.decode("utf-8", errors="replace").strip()
+        last_error = RuntimeError(message or f"gh {args[0]} exited with {proc.returncode}")
+    raise last_error
+
+async def _workflow_runs_cli() -> Dict[str, Any]:
+    """Collect recent GitHub workflow runs via the gh CLI."""
+    stdout = await _run_gh_with_retry([
+        "run", "list", "--limit", "15", "--json",
+        "name,status,conclusion,createdAt,updatedAt,databaseId,headBranch,event",
+    ])
+    runs = json.loads(stdout)
+    return {"runs": runs, "count": len(runs)}
+
+@swr_cache(fresh=15, stale=60)
+async def _runner_status_cached() -> Dict[str, Any]:
+    return await asyncio.to_thread(_runner_status)
+
+@swr_cache(fresh=15, stale=60)
+async def _workflow_runs_cached() -> Dict[str, Any]:
+    return await _workflow_runs()
+
+def _tasks_payload() -> Dict[str, Any]:
+    """Collect the task queue with per-status counts."""
+    tasks = load_tasks()
+
+    # Calculate stats
+    stats = {"total": len(tasks), "pending": 0, "in_progress": 0, "completed": 0}
+    for t in tasks:
+        status = t.get("status", "pending")
+        if status in stats:
+            stats[status] += 1
+
+    return {"tasks": tasks, "stats": stats}
+
+_tasks_cache: tuple | None = None  # ((st_mtime_ns, st_size), payload, JSON bytes)
+
+async def _tasks_snapshot() -> tuple[Dict[str, Any], bytes]:
+    """Return the task payload and its JSON bytes, re-read only when the file changes.
+
+    A hit costs one stat(); a miss reads and encodes in a worker thread.
+    """
+    global _tasks_cache
+    try:
+        st = (WORKSPACE_ROOT / "current_tasks.json").stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    cached = _tasks_cache
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    def build():
+        payload = _tasks_payload()
+        return payload, dumps_json(payload)
+
+    payload, body = await asyncio.to_thread(build)
+    _tasks_cache = (key, payload, body)
+    return payload, body
+
+async def _tasks_cached() -> Dict[str, Any]:
+    payload, _ = await _tasks_snapshot()
+    return payload
+
 @app.get("/api/orchestrator")
 def api_orchestrator():
     """Get orchestrator status.
@@ -260,34 +604,16 @@ def api_orchestrator():
     """
     # Modified: 2026-02-07T07:30:00Z | Author: COPILOT | Change: Use sync def for thread pool execution
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
-        return JSONResponse(content=orch.status(skip_dashboard_check=True))
+        return JSONResponse(content=_orchestrator_status())
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
 @app.get("/api/runner")
-def api_runner():
+async def api_runner():
     """Get GitHub runner status with detailed info."""
     try:
-        from slate.slate_runner_manager import SlateRunnerManager
-        mgr = SlateRunnerManager()
-        detection = mgr.detect()
-
-        # Add GitHub API runner status
-        try:
-            gh_cli = get_gh_cli()
-            result = subprocess.run(
-                [gh_cli, "api", "repos/SynchronizedLivingArchitecture/S.L.A.T.E/actions/runners",
-                 "--jq", ".runners[0]"],
-                capture_output=True, text=True, timeout=10, cwd=str(WORKSPACE_ROOT)
-            )
-            if result.returncode == 0:
-                detection["github_runner"] = json.loads(result.stdout)
-        except Exception:
-            pass
-
-        return JSONResponse(content=detection)
+        body = await _runner_status_cached.json_body()
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -295,16 +621,8 @@ def api_runner():
 async def api_workflows():
     """Get recent GitHub workflow runs."""
     try:
-        gh_cli = get_gh_cli()
-        result = subprocess.run(
-            [gh_cli, "run", "list", "--limit", "15", "--json",
-             "name,status,conclusion,createdAt,updatedAt,databaseId,headBranch,event"],
-            capture_output=True, text=True, timeout=15, cwd=str(WORKSPACE_ROOT)
-        )
-        if result.returncode == 0:
-            runs = json.loads(result.stdout)
-            return JSONResponse(content={"runs": runs, "count": len(runs)})
-        return JSONResponse(content={"error": result.stderr, "runs": []})
+        body = await _workflow_runs_cached.json_body()
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         return JSONResponse(content={"error": str(e), "runs": []})
 
@@ -357,9 +675,7 @@ async def api_workflow_pipeline():
 
         # Get runner status
         try:
-            from slate.slate_runner_manager import SlateRunnerManager
-            mgr = SlateRunnerManager()
-            detection = mgr.detect()
+            detection = get_runner_manager().detect()
             pipeline["runner_online"] = detection.get("runner_installed", False)
             pipeline["runner_busy"] = pipeline["workflows_running"] > 0
         except Exception:
@@ -875,18 +1191,14 @@ async def api_services():
 
     # Orchestrator
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
-        status = orch.status()
+        status = get_orchestrator().status()
         services.append({"id": "orch", "name": "Orchestrator", "online": status.get("orchestrator", {}).get("running", False)})
     except Exception:
         services.append({"id": "orch", "name": "Orchestrator", "online": False})
 
     # GitHub Runner
     try:
-        from slate.slate_runner_manager import SlateRunnerManager
-        mgr = SlateRunnerManager()
-        detection = mgr.detect()
+        detection = get_runner_manager().detect()
         services.append({"id": "runner", "name": "GitHub Runner", "online": detection.get("runner_installed", False)})
     except Exception:
         services.append({"id": "runner", "name": "GitHub Runner", "online": False})
@@ -1034,16 +1346,8 @@ async def api_task_activity():
 @app.get("/api/tasks")
 async def api_tasks():
     """Get all tasks."""
-    tasks = load_tasks()
-
-    # Calculate stats
-    stats = {"total": len(tasks), "pending": 0, "in_progress": 0, "completed": 0}
-    for t in tasks:
-        status = t.get("status", "pending")
-        if status in stats:
-            stats[status] += 1
-
-    return JSONResponse(content={"tasks": tasks, "stats": stats})
+    _, body = await _tasks_snapshot()
+    return Response(content=body, media_type="application/json")
 
 @app.post("/api/tasks")
 async def create_task(request: Request):
@@ -2253,8 +2557,7 @@ async def _get_status_async() -> dict:
     """
     loop = asyncio.get_event_loop()
     try:
-        from slate.slate_orchestrator import SlateOrchestrator
-        orch = SlateOrchestrator()
+        orch = get_orchestrator()
         return await loop.run_in_executor(None, lambda: orch.status(skip_dashboard_check=True))
     except Exception:
         return {"error": "status unavailable"}
@@ -2377,6 +2680,79 @@ async def websocket_endpoint(websocket: WebSocket):
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+
+# ─── Status Stream ────────────────────────────────────────────────────────────
+# Replaces the dashboard's fan-out polling of /api/orchestrator, /api/runner,
+# /api/workflows and /api/tasks. The REST endpoints remain as fallback.
+
+STATUS_STREAM_INTERVAL = 10.0  # seconds between recomputes
+
+async def _status_section(collect) -> Dict[str, Any]:
+    """Run a status collector, capturing errors.
+
+    Coroutine functions are awaited directly; blocking callables run in a worker thread.
+    """
+    try:
+        if asyncio.iscoroutinefunction(collect):
+            return await collect()
+        return await asyncio.to_thread(collect)
+    except Exception as e:
+        return {"error": str(e)}
+
+async def _status_frame() -> Dict[str, Any]:
+    """Build one merged status frame for the /ws/status stream."""
+    orchestrator, runner, workflows, tasks = await asyncio.gather(
+        _status_section(_orchestrator_status),
+        _status_section(_runner_status_cached),
+        _status_section(_workflow_runs_cached),
+        _status_section(_tasks_cached),
+    )
+    return {"orchestrator": orchestrator, "runner": runner, "workflows": workflows, "tasks": tasks}
+
+
+@app.websocket("/ws/status")
+async def websocket_status(websocket: WebSocket):
+    """Push merged status frames, sending only when the state has changed.
+
+    Clients may send {"type": "refresh"} to force an immediate recompute
+    and resend of the current frame.
+    """
+    await websocket.accept()
+    wake = asyncio.Event()
+    force = False
+
+    async def push_frames():
+        nonlocal force
+        last_hash = None
+        while True:
+            frame = await _status_frame()
+            frame_hash = hash(json.dumps(frame, sort_keys=True, default=str))
+            if force or frame_hash != last_hash:
+                last_hash = frame_hash
+                force = False
+                await websocket.send_json(frame)
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=STATUS_STREAM_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    pusher = asyncio.create_task(push_frames())
+    try:
+        while True:
+            data = await websocket.receive_text()
+            try:
+                msg = json.loads(data)
+            except ValueError:
+                continue
+            if msg.get("type") == "refresh":
+                force = True
+                wake.set()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        pusher.cancel()
+
 # ─── Dashboard HTML ───────────────────────────────────────────────────────────
 
 DASHBOARD_HTML = """
@@ -7651,18 +8027,57 @@ DASHBOARD_HTML = """
 """
 
 # Modified: 2026-02-07T10:30:00Z | Author: COPILOT | Change: Use new M3/Awwwards template builder
-@app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Serve the SLATE dashboard with M3/Awwwards design."""
+@functools.lru_cache(maxsize=1)
+def _dashboard_page() -> tuple[bytes, bytes, str]:
+    """Build the dashboard HTML once: raw bytes, gzip bytes and ETag."""
     try:
         from slate_web.dashboard_template import get_full_template
-        return get_full_template()
+        html = get_full_template()
     except Exception:
         # Fallback to legacy template if the new builder fails
-        return DASHBOARD_HTML
+        html = DASHBOARD_HTML
+    body = html.encode("utf-8")
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    return body, gzip.compress(body), etag
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Serve the SLATE dashboard with M3/Awwwards design."""
+    body, body_gzip, etag = _dashboard_page()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=300",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=body_gzip, media_type="text/html", headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
+# Worker processes do not share caches or WebSocket clients: each keeps its own
+# SWR entries and broadcasts only to its own connections, so stay at 1 unless
+# that is acceptable.
+DASHBOARD_WORKERS = max(1, int(os.environ.get("SLATE_DASHBOARD_WORKERS", "1")))
+
+def _server_options() -> Dict[str, Any]:
+    """Choose uvloop and httptools when installed (uvloop has no Windows build)."""
+    options: Dict[str, Any] = {}
+    try:
+        import uvloop  # noqa: F401
+        options["loop"] = "uvloop"
+    except ImportError:
+        options["loop"] = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        options["http"] = "httptools"
+    except ImportError:
+        options["http"] = "h11"
+    return options
+
 def main():
     """Run the dashboard server."""
     print()
@@ -7676,12 +8091,16 @@ def main():
     print("  Press Ctrl+C to stop")
     print()
 
+    # Multiple workers need an import string so each process can load the app
+    target = app if DASHBOARD_WORKERS == 1 else "agents.slate_dashboard_server:app"
     uvicorn.run(
-        app,
+        target,
         host="127.0.0.1",
         port=8080,
+        workers=DASHBOARD_WORKERS,
         log_level="warning",
-        access_log=False
+        access_log=False,
+        **_server_options(),
     )
 
 
@@ -7,11 +7,19 @@ and Kubernetes Secret/ConfigMap/environment variable definitions.
 Scans issue/PR titles, descriptions, comments, and K8s manifests before deployment.
 """
 
+import array
+import functools
+import ipaddress
 import re
 import sys
 from pathlib import Path
 from typing import NamedTuple
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # PII detection patterns
 PII_PATTERNS: dict[str, re.Pattern] = {
     "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
@@ -20,7 +28,13 @@ PII_PATTERNS: dict[str, re.Pattern] = {
     "ssn": re.compile(r"\b[0-9]{3}[-\s]?[0-9]{2}[-\s]?[0-9]{4}\b"),
     "credit_card": re.compile(r"\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|6(?:011|5[0-9]{2})[0-9]{12})\b"),
     "ip_address": re.compile(r"\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b"),
-    "api_key": re.compile(r"\b(?:sk|pk|api|key|token|secret|password|bearer)[-_]?[A-Za-z0-9]{16,}\b", re.IGNORECASE),
+    # Keyword case spelled out in classes rather than IGNORECASE, so the engine
+    # compares plain character sets instead of case-folding every character
+    "api_key": re.compile(
+        r"\b(?:[Ss][Kk]|[Pp][Kk]|[Aa][Pp][Ii]|[Kk][Ee][Yy]|[Tt][Oo][Kk][Ee][Nn]"
+        r"|[Ss][Ee][Cc][Rr][Ee][Tt]|[Pp][Aa][Ss][Ss][Ww][Oo][Rr][Dd]|[Bb][Ee][Aa][Rr][Ee][Rr])"
+        r"[-_]?[A-Za-z0-9]{16,}\b"
+    ),
     "aws_key": re.compile(r"\bAKIA[0-9A-Z]{16}\b"),
     "github_token": re.compile(r"\b(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9]{36,}\b"),
     "private_key": re.compile(r"-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----"),
@@ -29,19 +43,141 @@ PII_PATTERNS: dict[str, re.Pattern] = {
     "date_of_birth": re.compile(r"\b(?:dob|birth\s*date|date\s*of\s*birth)[:\s]+[0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}\b", re.IGNORECASE),
 }
 
-# Allowlist patterns (things that look like PII but aren't)
-ALLOWLIST_PATTERNS: list[re.Pattern] = [
-    re.compile(r"\b127\.0\.0\.1\b"),  # localhost
-    re.compile(r"\b0\.0\.0\.0\b"),  # any interface
-    re.compile(r"\b192\.168\.\d+\.\d+\b"),  # private IP
-    re.compile(r"\b10\.\d+\.\d+\.\d+\b"),  # private IP
-    re.compile(r"\b172\.(?:1[6-9]|2[0-9]|3[01])\.\d+\.\d+\b"),  # private IP
-    re.compile(r"\bexample\.com\b"),  # example domain
-    re.compile(r"\btest@test\.com\b"),  # test email
-    re.compile(r"\buser@example\.com\b"),  # example email
-    re.compile(r"\bnoreply@anthropic\.com\b"),  # Claude co-author
-    re.compile(r"\bnoreply@github\.com\b"),  # GitHub noreply
-]
+# Interned type names and their ids for the compact (SoA) scan results
+PII_TYPE_NAMES: tuple[str, ...] = tuple(sys.intern(name) for name in PII_PATTERNS)
+_PII_TYPE_IDS = {name: i for i, name in enumerate(PII_TYPE_NAMES)}
+
+
+def _combine_patterns(patterns: dict[str, re.Pattern]) -> re.Pattern:
+    """Merge named patterns into one alternation so text is walked once.
+
+    Each pattern becomes a named group; per-pattern IGNORECASE is preserved
+    with a scoped inline flag. Where spans overlap, the earlier pattern in
+    ``patterns`` wins, so the merged pattern only answers whether anything
+    matches; overlapping matches need the individual patterns.
+    """
+    parts = []
+    for name, pattern in patterns.items():
+        body = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            body = f"(?i:{body})"
+        parts.append(f"(?P<{name}>{body})")
+    return re.compile("|".join(parts))
+
+
+_COMBINED_PII_PATTERN = _combine_patterns(PII_PATTERNS)
+
+
+def _build_hyperscan_database(patterns: dict[str, re.Pattern]):
+    """Compile patterns into a Hyperscan database, or None if unavailable.
+
+    The database is only used as a prefilter: a single DFA pass that answers
+    "could anything match?" so clean text skips the backtracking ``re`` scan.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[p.pattern.encode("ascii") for p in patterns.values()],
+            ids=list(range(len(patterns))),
+            flags=[
+                hyperscan.HS_FLAG_SINGLEMATCH
+                | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                for p in patterns.values()
+            ],
+        )
+        return database
+    except Exception:
+        return None
+
+
+_HYPERSCAN_DB = _build_hyperscan_database(PII_PATTERNS)
+
+# Python's str \s also matches these ASCII separators; Hyperscan's does not
+_HYPERSCAN_UNSAFE_CHARS = "\x1c\x1d\x1e\x1f"
+
+
+def _hyperscan_rules_out(text: str) -> bool:
+    """Return True if the Hyperscan prefilter proves text contains no PII.
+
+    Hyperscan's word, digit and boundary classes are ASCII-only, so non-ASCII
+    text always falls through to the ``re`` scan to avoid false negatives.
+    """
+    if _HYPERSCAN_DB is None or not text.isascii():
+        return False
+    if any(c in text for c in _HYPERSCAN_UNSAFE_CHARS):
+        return False
+    hit = False
+
+    def on_match(pattern_id, start, end, flags, context):
+        nonlocal hit
+        hit = True
+        return True  # stop scanning at the first hit
+
+    try:
+        _HYPERSCAN_DB.scan(text.encode("ascii"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass  # raised when the callback stops the scan early
+    except Exception:
+        return False
+    return not hit
+
+
+# Cheap literal evidence at least one PII pattern needs in order to match
+_PREFILTER_CHARS = "0123456789@"  # every other pattern needs a digit or "@"
+_PREFILTER_LITERALS = ("eyJ", "AKIA", "-----BEGIN", "ghp_", "gho_", "ghu_", "ghs_", "ghr_")
+_PREFILTER_KEYWORDS = ("sk", "pk", "api", "key", "token", "secret", "password", "bearer")
+
+
+def _may_contain_pii(text: str) -> bool:
+    """Fast-path check using C-level substring searches before any regex runs.
+
+    Returns False only when no pattern can possibly match. Non-ASCII text is
+    always passed through because digit classes and case folding are Unicode-aware.
+    """
+    if not text.isascii():
+        return True
+    if any(c in text for c in _PREFILTER_CHARS):
+        return True
+    if any(lit in text for lit in _PREFILTER_LITERALS):
+        return True
+    lowered = text.lower()
+    return any(kw in lowered for kw in _PREFILTER_KEYWORDS)
+
+
+# Replacement text per PII type, built once
+REDACTION_MARKERS = {name: f"[REDACTED:{name.upper()}]" for name in PII_PATTERNS}
+
+# PII types that block content from public projects outright
+CRITICAL_PII_TYPES = frozenset({"ssn", "credit_card", "private_key", "aws_key"})
+
+def _find_pii(text: str) -> list[tuple[str, re.Match]]:
+    """Return (type, match) pairs for every pattern, ordered by position.
+
+    One merged search rules out clean text; otherwise each pattern is run on
+    its own, since the merged alternation drops overlapping matches (e.g. a
+    phone number used as the local part of an allowlisted email).
+    """
+    if _COMBINED_PII_PATTERN.search(text) is None:
+        return []
+    found = [
+        (name, match)
+        for name, pattern in zip(PII_TYPE_NAMES, PII_PATTERNS.values())
+        for match in pattern.finditer(text)
+    ]
+    found.sort(key=lambda pair: pair[1].start())
+    return found
+
+
+# Allowlisted values (things that look like PII but aren't)
+ALLOWLIST_EMAILS = frozenset({
+    "test@test.com",  # test email
+    "user@example.com",  # example email
+    "noreply@anthropic.com",  # Claude co-author
+    "noreply@github.com",  # GitHub noreply
+})
+ALLOWLIST_EMAIL_DOMAINS = frozenset({"example.com"})  # example domain
 
 
 class PIIMatch(NamedTuple):
@@ -52,41 +188,105 @@ class PIIMatch(NamedTuple):
     end: int
 
 
-def is_allowlisted(text: str, match: re.Match) -> bool:
-    """Check if a match is in the allowlist."""
-    matched_text = match.group()
-    for pattern in ALLOWLIST_PATTERNS:
-        if pattern.search(matched_text):
+def is_allowlisted(match: re.Match, pii_type: str) -> bool:
+    """Check if a match is in the allowlist.
+
+    IP addresses are allowed when loopback, unspecified or private; emails
+    when the address or its domain is allowlisted. Other types never are.
+    """
+    if pii_type == "ip_address":
+        try:
+            ip = ipaddress.ip_address(match.group())
+        except ValueError:
+            return False
+        return ip.is_private or ip.is_loopback or ip.is_unspecified
+    if pii_type == "email":
+        email = match.group().lower()
+        if email in ALLOWLIST_EMAILS:
             return True
+        domain = email.rpartition("@")[2]
+        return domain in ALLOWLIST_EMAIL_DOMAINS or any(
+            domain.endswith("." + allowed) for allowed in ALLOWLIST_EMAIL_DOMAINS
+        )
     return False
 
 
+# Texts up to this length are memoized; larger bodies are scanned uncached
+# so the cache never pins big manifests or logs in memory.
+SCAN_CACHE_MAX_TEXT_LEN = 16_384
+
+
+def _scan_uncached(text: str) -> tuple[PIIMatch, ...]:
+    """Run the fast paths and the regex scan over text."""
+    if not _may_contain_pii(text) or _hyperscan_rules_out(text):
+        return ()
+
+    matches: list[PIIMatch] = []
+
+    for pii_type, match in _find_pii(text):
+        if not is_allowlisted(match, pii_type):
+            matches.append(PIIMatch(
+                pii_type=pii_type,
+                value=match.group(),
+                start=match.start(),
+                end=match.end()
+            ))
+
+    return tuple(matches)
+
+
+_scan_cached = functools.lru_cache(maxsize=4096)(_scan_uncached)
+
+
+def clear_scan_cache() -> None:
+    """Drop memoized scan results (e.g. between tests)."""
+    _scan_cached.cache_clear()
+
+
 def scan_text(text: str) -> list[PIIMatch]:
     """
     Scan text for PII patterns.
 
+    Results for repeated texts (issue titles re-checked on every poll) are
+    memoized; PIIMatch is immutable so cached matches are safe to share.
+
     Args:
         text: The text to scan
 
     Returns:
-        List of PII matches found
+        List of PII matches found, in order of position
     """
     if not text:
         return []
+    if len(text) > SCAN_CACHE_MAX_TEXT_LEN:
+        return list(_scan_uncached(text))
+    return list(_scan_cached(text))
 
-    matches: list[PIIMatch] = []
 
-    for pii_type, pattern in PII_PATTERNS.items():
-        for match in pattern.finditer(text):
-            if not is_allowlisted(text, match):
-                matches.append(PIIMatch(
-                    pii_type=pii_type,
-                    value=match.group(),
-                    start=match.start(),
-                    end=match.end()
-                ))
+def scan_text_soa(text: str) -> tuple[array.array, array.array, array.array]:
+    """
+    Scan text for PII, returning parallel arrays instead of PIIMatch objects.
 
-    return matches
+    Meant for bulk scans where per-match objects dominate memory. Values are
+    not kept; slice ``text[start:end]`` if needed. Results are not memoized.
+
+    Args:
+        text: The text to scan
+
+    Returns:
+        Tuple of (starts, ends, type ids), where a type id indexes PII_TYPE_NAMES
+    """
+    starts, ends, type_ids = array.array("q"), array.array("q"), array.array("B")
+    if not text or not _may_contain_pii(text) or _hyperscan_rules_out(text):
+        return starts, ends, type_ids
+
+    for pii_type, match in _find_pii(text):
+        if not is_allowlisted(match, pii_type):
+            starts.append(match.start())
+            ends.append(match.end())
+            type_ids.append(_PII_TYPE_IDS[pii_type])
+
+    return starts, ends, type_ids
 
 
 def redact_text(text: str) -> tuple[str, list[PIIMatch]]:
@@ -106,15 +306,23 @@ def redact_text(text: str) -> tuple[str, list[PIIMatch]]:
     if not matches:
         return text, []
 
-    # Sort by position (reverse) to replace from end
-    sorted_matches = sorted(matches, key=lambda m: m.start, reverse=True)
+    return _redact_with(text, matches), matches
+
 
-    redacted = text
-    for match in sorted_matches:
-        redaction = f"[REDACTED:{match.pii_type.upper()}]"
-        redacted = redacted[:match.start] + redaction + redacted[match.end:]
+def _redact_with(text: str, matches: list[PIIMatch]) -> str:
+    """Replace already-found matches in text with redaction markers (no rescan)."""
+    # Single pass: collect the untouched slices and markers, join once
+    parts: list[str] = []
+    cursor = 0
+    for match in sorted(matches, key=lambda m: m.start):
+        if match.start < cursor:
+            continue  # overlaps a span already redacted
+        parts.append(text[cursor:match.start])
+        parts.append(REDACTION_MARKERS[match.pii_type])
+        cursor = match.end
+    parts.append(text[cursor:])
 
-    return redacted, matches
+    return "".join(parts)
 
 
 def scan_github_content(title: str, body: str | None = None) -> dict:
@@ -143,22 +351,18 @@ def scan_github_content(title: str, body: str | None = None) -> dict:
     if title_matches:
         results["has_pii"] = True
         results["title_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in title_matches]
-        results["redacted_title"], _ = redact_text(title)
+        results["redacted_title"] = _redact_with(title, title_matches)
 
     # Scan body
-    if body:
-        body_matches = scan_text(body)
-        if body_matches:
-            results["has_pii"] = True
-            results["body_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in body_matches]
-            results["redacted_body"], _ = redact_text(body)
+    body_matches = scan_text(body) if body else []
+    if body_matches:
+        results["has_pii"] = True
+        results["body_pii"] = [{"type": m.pii_type, "value": "[hidden]"} for m in body_matches]
+        results["redacted_body"] = _redact_with(body, body_matches)
 
     # Determine if blocked
-    critical_types = {"ssn", "credit_card", "private_key", "aws_key"}
-    all_matches = title_matches + (scan_text(body) if body else [])
-
-    for match in all_matches:
-        if match.pii_type in critical_types:
+    for match in title_matches + body_matches:
+        if match.pii_type in CRITICAL_PII_TYPES:
             results["blocked"] = True
             results["message"] = f"Critical PII detected ({match.pii_type}). Item blocked from public project."
             break
@@ -27,101 +27,93 @@ Usage:
     svg = engine.render_svg()
 """
 
-from .components import (
-    # Config
-    SchematicConfig,
-
-    # Enums
-    ComponentType,
-    ComponentStatus,
-    ConnectionStyle,
-    PortPosition,
-
-    # Base classes
-    Component,
-    Connection,
-    Port,
-    Annotation,
-    Layer,
-
-    # Node components
-    ServiceNode,
-    DatabaseNode,
-    GPUNode,
-    AINode,
-    APINode,
-    QueueNode,
-    ExternalNode,
-
-    # Connection components
-    FlowConnector,
-    DashedConnector,
-    DataBus,
-
-    # Terminal components
-    InputTerminal,
-    OutputTerminal,
-)
-
-from .layout import (
-    LayoutEngine,
-    LayoutResult,
-    HierarchicalLayout,
-    ForceDirectedLayout,
-    GridLayout,
-    get_layout_engine,
-)
-
-from .theme import (
-    ThemeManager,
-    SchematicTheme,
-    SchematicColors,
-    SchematicTypography,
-    SchematicEffects,
-    BlueprintTheme,
-    DarkTheme,
-    LightTheme,
-)
-
-from .svg_renderer import SVGRenderer
-
-from .engine import (
-    SchematicEngine,
-    generate_system_diagram,
-    generate_from_tech_tree,
-    generate_from_system_state,
-)
-
-# Modified: 2026-02-08T01:25:00Z | Author: COPILOT | Change: Add library and exporter imports
-from .library import (
-    TEMPLATES,
-    build_from_template,
-    list_templates,
-    get_slate_system_template,
-    get_ai_inference_template,
-    get_cicd_pipeline_template,
-    slate_dashboard,
-    slate_ollama,
-    slate_foundry,
-    slate_chromadb,
-    slate_dual_gpu,
-    slate_gpu,
-    slate_runner,
-    slate_vscode,
-    slate_claude,
-    slate_task_router,
-    slate_workflow_manager,
-    github_api,
-    slate_model,
-)
-
-from .exporters import (
-    SVGExporter,
-    HTMLExporter,
-    Base64Exporter,
-    MarkdownExporter,
-    JSONExporter,
-)
+import importlib
+
+# Exported names by submodule. Submodules are imported on first attribute
+# access (PEP 562), so importing the package alone stays cheap.
+_SUBMODULE_EXPORTS = {
+    ".components": (
+        "SchematicConfig",
+        "ComponentType",
+        "ComponentStatus",
+        "ConnectionStyle",
+        "PortPosition",
+        "Component",
+        "Connection",
+        "Port",
+        "port",
+        "Annotation",
+        "Layer",
+        "ServiceNode",
+        "DatabaseNode",
+        "GPUNode",
+        "AINode",
+        "APINode",
+        "QueueNode",
+        "ExternalNode",
+        "FlowConnector",
+        "DashedConnector",
+        "DataBus",
+        "InputTerminal",
+        "OutputTerminal",
+    ),
+    ".layout": (
+        "LayoutEngine",
+        "LayoutResult",
+        "HierarchicalLayout",
+        "ForceDirectedLayout",
+        "GridLayout",
+        "get_layout_engine",
+    ),
+    ".theme": (
+        "ThemeManager",
+        "SchematicTheme",
+        "SchematicColors",
+        "SchematicTypography",
+        "SchematicEffects",
+        "BlueprintTheme",
+        "DarkTheme",
+        "LightTheme",
+    ),
+    ".svg_renderer": (
+        "SVGRenderer",
+    ),
+    ".engine": (
+        "SchematicEngine",
+        "generate_system_diagram",
+        "generate_from_tech_tree",
+        "generate_from_system_state",
+    ),
+    ".library": (
+        "TEMPLATES",
+        "build_from_template",
+        "list_templates",
+        "get_slate_system_template",
+        "get_ai_inference_template",
+        "get_cicd_pipeline_template",
+        "slate_dashboard",
+        "slate_ollama",
+        "slate_foundry",
+        "slate_chromadb",
+        "slate_dual_gpu",
+        "slate_gpu",
+        "slate_runner",
+        "slate_vscode",
+        "slate_claude",
+        "slate_task_router",
+        "slate_workflow_manager",
+        "github_api",
+        "slate_model",
+    ),
+    ".exporters": (
+        "SVGExporter",
+        "HTMLExporter",
+        "Base64Exporter",
+        "MarkdownExporter",
+        "JSONExporter",
+    ),
+}
+_LAZY = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
 
 __version__ = "1.1.0"
 __all__ = [
@@ -138,6 +130,7 @@ __all__ = [
     "Component",
     "Connection",
     "Port",
+    "port",
     "Annotation",
     "Layer",
 
@@ -214,3 +207,16 @@ __all__ = [
     "MarkdownExporter",
     "JSONExporter",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,17 +11,140 @@ Usage:
 """
 
 import argparse
+import functools
+import itertools
 import json
 import sys
 from pathlib import Path
+from typing import Iterator
 
-# Add workspace root for imports
-WORKSPACE_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(WORKSPACE_ROOT))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# Run as a plain script (python slate/schematic_sdk/cli.py) the workspace
+# root is not importable; under python -m it already is
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-def main():
+from slate.schematic_sdk.exporters import ensure_parent_dir, write_utf8  # noqa: E402
+
+
+def _loads(data):
+    """Parse JSON from str or bytes, via orjson when installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps(obj) -> str:
+    """Serialize to 2-space indented JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """Return libyaml's CSafeLoader when compiled in, else the pure-Python SafeLoader.
+
+    Raises ImportError if PyYAML is not installed.
+    """
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_definition(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML/JSON definition file.
+
+    Cached on (path, mtime, size) so a file is parsed once per process while
+    unchanged. Callers must not mutate the returned dict.
+    """
+    path = Path(path_str)
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        with path.open("rb") as f:
+            return yaml.load(f, Loader=_get_yaml_loader())
+    # Hand the parser raw bytes rather than decoding to str first
+    with path.open("rb") as f:
+        return _loads(f.read())
+
+
+def _load_definition(input_path: Path) -> dict:
+    """Parse a definition file through the (path, mtime, size) cache."""
+    st = input_path.stat()
+    return _parse_definition(str(input_path), st.st_mtime_ns, st.st_size)
+
+
+def _silent(*args, **kwargs) -> None:
+    pass
+
+
+def _status_logger(args):
+    """Return print for status messages, or a no-op under --quiet.
+
+    Errors and requested output (validation failures, component lists)
+    are always written.
+    """
+    return _silent if getattr(args, "quiet", False) else print
+
+
+def _add_from_system_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--output", "-o", required=True, help="Output SVG file path")
+    p.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
+    p.add_argument("--format", default="svg", choices=["svg", "html"])
+
+
+def _add_from_tech_tree_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--output", "-o", required=True, help="Output SVG file path")
+    p.add_argument("--input", "-i", default=".slate_tech_tree/tech_tree.json", help="Tech tree JSON path")
+    p.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
+
+
+def _add_generate_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--input", "-i", required=True, help="Input YAML/JSON file")
+    p.add_argument("--output", "-o", required=True, help="Output SVG file path")
+    p.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
+    p.add_argument("--layout", default="hierarchical", choices=["hierarchical", "force", "grid"])
+
+
+def _add_components_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--list", "-l", action="store_true", help="List all components")
+    p.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_validate_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--input", "-i", required=True, help="Input file to validate")
+    p.add_argument("--fail-fast", action="store_true", help="Stop at the first error")
+
+
+# Subcommand -> (help text, argument builder)
+_SUBCOMMANDS = {
+    "from-system": ("Generate from current system state", _add_from_system_args),
+    "from-tech-tree": ("Generate from tech tree JSON", _add_from_tech_tree_args),
+    "generate": ("Generate from YAML/JSON definition", _add_generate_args),
+    "components": ("List available components", _add_components_args),
+    "validate": ("Validate definition file", _add_validate_args),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, if any.
+
+    The top-level parser takes no valued options, so the first positional
+    token is the subcommand.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def main(argv: list[str] | None = None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         description="SLATE Schematic Diagram Generator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -41,37 +164,19 @@ Examples:
 """
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # from-system command
-    sys_parser = subparsers.add_parser("from-system", help="Generate from current system state")
-    sys_parser.add_argument("--output", "-o", required=True, help="Output SVG file path")
-    sys_parser.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
-    sys_parser.add_argument("--format", default="svg", choices=["svg", "html"])
-
-    # from-tech-tree command
-    tree_parser = subparsers.add_parser("from-tech-tree", help="Generate from tech tree JSON")
-    tree_parser.add_argument("--output", "-o", required=True, help="Output SVG file path")
-    tree_parser.add_argument("--input", "-i", default=".slate_tech_tree/tech_tree.json", help="Tech tree JSON path")
-    tree_parser.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
-
-    # generate command
-    gen_parser = subparsers.add_parser("generate", help="Generate from YAML/JSON definition")
-    gen_parser.add_argument("--input", "-i", required=True, help="Input YAML/JSON file")
-    gen_parser.add_argument("--output", "-o", required=True, help="Output SVG file path")
-    gen_parser.add_argument("--theme", default="blueprint", choices=["blueprint", "dark", "light"])
-    gen_parser.add_argument("--layout", default="hierarchical", choices=["hierarchical", "force", "grid"])
+    parser.add_argument("--quiet", "-q", action="store_true", help="Suppress status messages")
 
-    # components command
-    comp_parser = subparsers.add_parser("components", help="List available components")
-    comp_parser.add_argument("--list", "-l", action="store_true", help="List all components")
-    comp_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # validate command
-    val_parser = subparsers.add_parser("validate", help="Validate definition file")
-    val_parser.add_argument("--input", "-i", required=True, help="Input file to validate")
+    # Every subcommand is registered so --help lists them all, but only the
+    # one being run gets its arguments built
+    sniffed = _sniff_subcommand(argv)
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        sub_parser = subparsers.add_parser(name, help=help_text)
+        if name == sniffed:
+            add_arguments(sub_parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
@@ -97,45 +202,49 @@ Examples:
 
 def cmd_from_system(args) -> int:
     """Generate diagram from current system state."""
-    from slate.schematic_sdk import generate_from_system_state, SchematicEngine, SchematicConfig
+    log = _status_logger(args)
+    from slate.schematic_sdk import generate_from_system_state
 
-    print(f"Generating system diagram...")
+    log("Generating system diagram...")
 
     svg = generate_from_system_state()
 
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_parent_dir(output_path)
 
     if args.format == "html":
+        from slate.schematic_sdk import SchematicEngine, SchematicConfig
         config = SchematicConfig(title="SLATE System Architecture")
         engine = SchematicEngine(config)
         html_content = engine._wrap_in_html(svg)
-        output_path.write_text(html_content, encoding="utf-8")
+        write_utf8(output_path, html_content)
     else:
-        output_path.write_text(svg, encoding="utf-8")
+        write_utf8(output_path, svg)
 
-    print(f"Saved to: {output_path}")
+    log(f"Saved to: {output_path}")
     return 0
 
 
 def cmd_from_tech_tree(args) -> int:
     """Generate diagram from tech tree JSON."""
+    log = _status_logger(args)
     from slate.schematic_sdk import generate_from_tech_tree
 
-    print(f"Generating tech tree diagram from: {args.input}")
+    log(f"Generating tech tree diagram from: {args.input}")
 
     svg = generate_from_tech_tree(args.input)
 
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(svg, encoding="utf-8")
+    ensure_parent_dir(output_path)
+    write_utf8(output_path, svg)
 
-    print(f"Saved to: {output_path}")
+    log(f"Saved to: {output_path}")
     return 0
 
 
 def cmd_generate(args) -> int:
     """Generate diagram from YAML/JSON definition."""
+    log = _status_logger(args)
     from slate.schematic_sdk import SchematicEngine
 
     input_path = Path(args.input)
@@ -143,137 +252,144 @@ def cmd_generate(args) -> int:
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         return 1
 
-    print(f"Generating diagram from: {input_path}")
+    log(f"Generating diagram from: {input_path}")
 
     # Load definition
-    content = input_path.read_text(encoding="utf-8")
-
-    if input_path.suffix in (".yaml", ".yml"):
-        try:
-            import yaml
-            data = yaml.safe_load(content)
-        except ImportError:
-            print("Error: PyYAML not installed. Use JSON format or install pyyaml.", file=sys.stderr)
-            return 1
-    else:
-        data = json.loads(content)
+    try:
+        data = _load_definition(input_path)
+    except ImportError:
+        print("Error: PyYAML not installed. Use JSON format or install pyyaml.", file=sys.stderr)
+        return 1
 
-    # Apply CLI overrides
-    if "config" not in data:
-        data["config"] = {}
-    data["config"]["theme"] = args.theme
-    data["config"]["layout"] = args.layout
+    # Apply CLI overrides on a copy; the parsed definition is cached
+    config = {**data.get("config", {}), "theme": args.theme, "layout": args.layout}
+    data = {**data, "config": config}
 
     # Generate
     engine = SchematicEngine.from_dict(data)
     svg = engine.render_svg()
 
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(svg, encoding="utf-8")
+    ensure_parent_dir(output_path)
+    write_utf8(output_path, svg)
 
-    print(f"Saved to: {output_path}")
+    log(f"Saved to: {output_path}")
     return 0
 
 
-def cmd_components(args) -> int:
-    """List available components."""
-    components = {
-        "nodes": {
-            "ServiceNode": "Microservice/server (rounded rectangle)",
-            "DatabaseNode": "Data store (cylinder shape)",
-            "GPUNode": "GPU/compute resource (hexagon)",
-            "AINode": "AI/ML service (rounded rect + brain)",
-            "APINode": "API endpoint (rectangle + port)",
-            "QueueNode": "Message queue (parallelogram)",
-            "ExternalNode": "External service (dashed border)",
-        },
-        "connections": {
-            "FlowConnector": "Data flow with arrow (solid line)",
-            "DashedConnector": "Optional/async flow (dashed line)",
-            "DataBus": "Multi-connection bus (thick line)",
-        },
-        "terminals": {
-            "InputTerminal": "External input (circle + inward arrow)",
-            "OutputTerminal": "External output (circle + outward arrow)",
-        },
-        "layouts": {
-            "hierarchical": "Layer-based arrangement (best for architectures)",
-            "force": "Physics-based placement (best for networks)",
-            "grid": "Grid snap placement (best for dashboards)",
-        },
-        "themes": {
-            "blueprint": "Dark engineering blueprint (default)",
-            "dark": "Dark mode with earth tones",
-            "light": "Light mode for presentations",
-        }
+# Component catalogue shown by the components command
+_COMPONENTS = {
+    "nodes": {
+        "ServiceNode": "Microservice/server (rounded rectangle)",
+        "DatabaseNode": "Data store (cylinder shape)",
+        "GPUNode": "GPU/compute resource (hexagon)",
+        "AINode": "AI/ML service (rounded rect + brain)",
+        "APINode": "API endpoint (rectangle + port)",
+        "QueueNode": "Message queue (parallelogram)",
+        "ExternalNode": "External service (dashed border)",
+    },
+    "connections": {
+        "FlowConnector": "Data flow with arrow (solid line)",
+        "DashedConnector": "Optional/async flow (dashed line)",
+        "DataBus": "Multi-connection bus (thick line)",
+    },
+    "terminals": {
+        "InputTerminal": "External input (circle + inward arrow)",
+        "OutputTerminal": "External output (circle + outward arrow)",
+    },
+    "layouts": {
+        "hierarchical": "Layer-based arrangement (best for architectures)",
+        "force": "Physics-based placement (best for networks)",
+        "grid": "Grid snap placement (best for dashboards)",
+    },
+    "themes": {
+        "blueprint": "Dark engineering blueprint (default)",
+        "dark": "Dark mode with earth tones",
+        "light": "Light mode for presentations",
     }
+}
 
+
+@functools.lru_cache(maxsize=1)
+def _components_json() -> str:
+    return _dumps(_COMPONENTS)
+
+
+def cmd_components(args) -> int:
+    """List available components."""
     if args.json:
-        print(json.dumps(components, indent=2))
+        sys.stdout.write(_components_json())
+        sys.stdout.write("\n")
     else:
-        print("\nSLATE Schematic SDK - Available Components\n")
-        print("=" * 50)
-
-        for category, items in components.items():
-            print(f"\n{category.upper()}:")
-            for name, desc in items.items():
-                print(f"  {name:20} - {desc}")
+        lines = ["", "SLATE Schematic SDK - Available Components", "", "=" * 50]
+        for category, items in _COMPONENTS.items():
+            lines.append(f"\n{category.upper()}:")
+            lines.extend(f"  {name:20} - {desc}" for name, desc in items.items())
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
 
+def _iter_errors(data: dict) -> Iterator[str]:
+    """Yield validation errors for a definition lazily, in file order."""
+    from slate.schematic_sdk.components import COMPONENT_TYPES
+
+    # Check required fields
+    if "components" not in data and "nodes" not in data:
+        yield "Missing 'components' or 'nodes' field"
+
+    components = data.get("components") or data.get("nodes") or []
+
+    # Check components have required fields, collecting ids in the same pass
+    node_ids = set()
+    for i, comp in enumerate(components):
+        if "id" in comp:
+            node_ids.add(comp["id"])
+        else:
+            yield f"Component {i}: missing 'id' field"
+        if "label" not in comp:
+            yield f"Component {i}: missing 'label' field"
+        if "type" in comp and comp["type"] not in COMPONENT_TYPES:
+            yield f"Component {i}: unknown type '{comp['type']}'"
+
+    # Check connections reference valid nodes
+    is_node = node_ids.__contains__
+    for i, conn in enumerate(data.get("connections") or []):
+        if not is_node(conn.get("from_node")) and not is_node(conn.get("from")):
+            yield f"Connection {i}: invalid 'from' node"
+        if not is_node(conn.get("to_node")) and not is_node(conn.get("to")):
+            yield f"Connection {i}: invalid 'to' node"
+
+
 def cmd_validate(args) -> int:
     """Validate a definition file."""
+    log = _status_logger(args)
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Error: File not found: {input_path}", file=sys.stderr)
         return 1
 
-    print(f"Validating: {input_path}")
-
-    content = input_path.read_text(encoding="utf-8")
+    log(f"Validating: {input_path}")
 
     try:
-        if input_path.suffix in (".yaml", ".yml"):
-            import yaml
-            data = yaml.safe_load(content)
-        else:
-            data = json.loads(content)
+        data = _load_definition(input_path)
     except Exception as e:
         print(f"Parse error: {e}", file=sys.stderr)
         return 1
 
-    errors = []
-
-    # Check required fields
-    if "components" not in data and "nodes" not in data:
-        errors.append("Missing 'components' or 'nodes' field")
-
-    # Check components have required fields
-    for i, comp in enumerate(data.get("components", data.get("nodes", []))):
-        if "id" not in comp:
-            errors.append(f"Component {i}: missing 'id' field")
-        if "label" not in comp:
-            errors.append(f"Component {i}: missing 'label' field")
-
-    # Check connections reference valid nodes
-    node_ids = {c.get("id") for c in data.get("components", data.get("nodes", []))}
-    for i, conn in enumerate(data.get("connections", [])):
-        if conn.get("from_node") not in node_ids and conn.get("from") not in node_ids:
-            errors.append(f"Connection {i}: invalid 'from' node")
-        if conn.get("to_node") not in node_ids and conn.get("to") not in node_ids:
-            errors.append(f"Connection {i}: invalid 'to' node")
+    # With --fail-fast, stop the generator at the first error
+    errors = list(itertools.islice(_iter_errors(data), 1 if args.fail_fast else None))
 
     if errors:
-        print("\nValidation FAILED:")
-        for err in errors:
-            print(f"  - {err}")
+        sys.stdout.write("\nValidation FAILED:\n" + "".join(f"  - {err}\n" for err in errors))
         return 1
 
-    print("\nValidation PASSED")
-    print(f"  Components: {len(data.get('components', data.get('nodes', [])))}")
-    print(f"  Connections: {len(data.get('connections', []))}")
+    components = data.get("components") or data.get("nodes") or []
+    log(
+        "\nValidation PASSED\n"
+        f"  Components: {len(components)}\n"
+        f"  Connections: {len(data.get('connections') or [])}"
+    )
     return 0
 
 
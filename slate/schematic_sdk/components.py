@@ -5,8 +5,9 @@ Circuit-board style components for system diagram generation.
 Part of SLATE Generative UI protocols.
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, Final, List, Literal, Optional, Tuple
 from enum import Enum
 
 
@@ -45,7 +46,15 @@ class PortPosition(str, Enum):
     LEFT = "left"
 
 
-@dataclass
+# Plain-string values for validating raw definitions (YAML/JSON) without
+# constructing enum members. Enum members hash by name, so test .value.
+COMPONENT_TYPES: Final = frozenset(t.value for t in ComponentType)
+CONNECTION_STYLES: Final = frozenset(s.value for s in ConnectionStyle)
+COMPONENT_STATUSES: Final = frozenset(s.value for s in ComponentStatus)
+PORT_POSITIONS: Final = frozenset(p.value for p in PortPosition)
+
+
+@dataclass(frozen=True, slots=True)
 class Port:
     """Connection port on a component."""
     id: str
@@ -53,7 +62,24 @@ class Port:
     type: Literal["input", "output", "bidirectional"] = "bidirectional"
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def port(
+    id: str,
+    position: PortPosition = PortPosition.RIGHT,
+    type: Literal["input", "output", "bidirectional"] = "bidirectional",
+) -> Port:
+    """Return a shared Port instance; identical ports are created once."""
+    return Port(id=id, position=position, type=type)
+
+
+# Ports given to components that declare none
+_DEFAULT_PORTS = (
+    port("left", PortPosition.LEFT, "input"),
+    port("right", PortPosition.RIGHT, "output"),
+)
+
+
+@dataclass(slots=True)
 class Component:
     """Base component class for all schematic elements."""
     id: str
@@ -69,66 +95,47 @@ class Component:
 
     def __post_init__(self):
         if not self.ports:
-            # Default ports based on component type
-            self.ports = [
-                Port(id="left", position=PortPosition.LEFT, type="input"),
-                Port(id="right", position=PortPosition.RIGHT, type="output"),
-            ]
+            self.ports = list(_DEFAULT_PORTS)
+        # Node subclasses declare a default_size. Handled here rather than in
+        # per-subclass __post_init__ overrides: zero-argument super() does not
+        # work in slotted dataclasses before Python 3.14
+        if self.size is None:
+            self.size = getattr(self, "default_size", None)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceNode(Component):
     """Microservice/server component (rounded rectangle)."""
     type: ComponentType = field(default=ComponentType.SERVICE, init=False)
     shape: str = "rounded_rect"
     default_size: Tuple[float, float] = (140, 60)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
 
-
-@dataclass
+@dataclass(slots=True)
 class DatabaseNode(Component):
     """Data store component (cylinder shape)."""
     type: ComponentType = field(default=ComponentType.DATABASE, init=False)
     shape: str = "cylinder"
     default_size: Tuple[float, float] = (100, 80)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
-
 
-@dataclass
+@dataclass(slots=True)
 class GPUNode(Component):
     """GPU/compute resource component (hexagon shape)."""
     type: ComponentType = field(default=ComponentType.GPU, init=False)
     shape: str = "hexagon"
     default_size: Tuple[float, float] = (120, 80)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
-
 
-@dataclass
+@dataclass(slots=True)
 class AINode(Component):
     """AI/ML service component (rounded rect with brain accent)."""
     type: ComponentType = field(default=ComponentType.AI, init=False)
     shape: str = "ai_node"
     default_size: Tuple[float, float] = (140, 70)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
 
-
-@dataclass
+@dataclass(slots=True)
 class APINode(Component):
     """API endpoint component (rectangle with port badge)."""
     type: ComponentType = field(default=ComponentType.API, init=False)
@@ -136,39 +143,24 @@ class APINode(Component):
     port_number: Optional[int] = None
     default_size: Tuple[float, float] = (120, 50)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
-
 
-@dataclass
+@dataclass(slots=True)
 class QueueNode(Component):
     """Message queue component (parallelogram shape)."""
     type: ComponentType = field(default=ComponentType.QUEUE, init=False)
     shape: str = "parallelogram"
     default_size: Tuple[float, float] = (130, 50)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
-
 
-@dataclass
+@dataclass(slots=True)
 class ExternalNode(Component):
     """External service component (dashed border)."""
     type: ComponentType = field(default=ComponentType.EXTERNAL, init=False)
     shape: str = "external"
     default_size: Tuple[float, float] = (120, 60)
 
-    def __post_init__(self):
-        super().__post_init__()
-        if self.size is None:
-            self.size = self.default_size
-
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """Connection between components."""
     id: str
@@ -183,26 +175,26 @@ class Connection:
     color_override: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowConnector(Connection):
     """Standard data flow connector with arrow."""
     style: ConnectionStyle = ConnectionStyle.SOLID
 
 
-@dataclass
+@dataclass(slots=True)
 class DashedConnector(Connection):
     """Dashed connector for optional/async flows."""
     style: ConnectionStyle = ConnectionStyle.DASHED
 
 
-@dataclass
+@dataclass(slots=True)
 class DataBus(Connection):
     """Multi-connection data bus."""
     connected_nodes: List[str] = field(default_factory=list)
     bus_width: float = 4.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InputTerminal:
     """External input terminal."""
     id: str
@@ -211,7 +203,7 @@ class InputTerminal:
     connected_to: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputTerminal:
     """External output terminal."""
     id: str
@@ -220,7 +212,7 @@ class OutputTerminal:
     connected_from: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Annotation:
     """Text annotation for diagrams."""
     id: str
@@ -230,7 +222,7 @@ class Annotation:
     anchor: Literal["start", "middle", "end"] = "start"
 
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """Group of components at the same hierarchical level."""
     id: str
@@ -239,7 +231,7 @@ class Layer:
     y_position: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchematicConfig:
     """Configuration for schematic generation."""
     width: int = 900
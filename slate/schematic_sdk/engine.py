@@ -67,6 +67,14 @@ class SchematicEngine:
         self.annotations.append(annotation)
         return self
 
+    def reset(self) -> "SchematicEngine":
+        """Remove all nodes, connectors, annotations and positions, keeping config."""
+        self.components.clear()
+        self.connections.clear()
+        self.annotations.clear()
+        self.positions = {}
+        return self
+
     def set_layout(self, layout_type: str, **kwargs) -> "SchematicEngine":
         """Change layout engine."""
         self.layout_engine = get_layout_engine(layout_type, **kwargs)
@@ -90,11 +98,19 @@ class SchematicEngine:
 
     def render_svg(self) -> str:
         """Render the schematic to SVG string."""
+        return self._render(self.renderer.render)
+
+    def render_svg_bytes(self) -> bytes:
+        """Render the schematic to UTF-8 encoded SVG."""
+        return self._render(self.renderer.render_bytes)
+
+    def _render(self, render):
+        """Lay out the schematic if needed, then call a renderer method."""
         # Auto-apply layout if not done
         if not self.positions and self.components:
             self.apply_layout()
 
-        return self.renderer.render(
+        return render(
             components=self.components,
             connections=self.connections,
             positions=self.positions,
@@ -104,15 +120,13 @@ class SchematicEngine:
 
     def save(self, path: str, format: str = "svg") -> None:
         """Save schematic to file."""
-        svg_content = self.render_svg()
-
         output_path = Path(path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "svg":
-            output_path.write_text(svg_content, encoding="utf-8")
+            output_path.write_bytes(self.render_svg_bytes())
         elif format == "html":
-            html_content = self._wrap_in_html(svg_content)
+            html_content = self._wrap_in_html(self.render_svg())
             output_path.write_text(html_content, encoding="utf-8")
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -8,10 +8,82 @@ and targets (file, HTML wrapper, base64, JSON manifest).
 """
 
 import base64
+import functools
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, via orjson when installed.
+
+    Non-ASCII text is written unescaped on both paths, as orjson always does.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder copes
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _ensure_dir(parent: str) -> None:
+    Path(parent).mkdir(parents=True, exist_ok=True)
+
+
+def ensure_parent_dir(path: Path) -> None:
+    """Create path's parent directory, once per directory per process.
+
+    A directory removed after its first use is not recreated.
+    """
+    _ensure_dir(str(path.parent))
+
+
+def write_utf8(path: Path, content: str) -> None:
+    """Write content to path as UTF-8 bytes in a single binary write.
+
+    Skips the text-mode I/O layer; newlines are written unchanged.
+    """
+    with path.open("wb") as f:
+        f.write(content.encode("utf-8"))
+
+
+# Standalone page for HTMLExporter.wrap; CSS braces are doubled for str.format
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            margin: 0;
+            padding: 20px;
+            background: {background};
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+        }}
+        svg {{
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
+        }}
+    </style>
+</head>
+<body>
+{svg_content}
+</body>
+</html>"""
+
 
 class SVGExporter:
     """Export SVG to file."""
@@ -29,8 +101,8 @@ class SVGExporter:
             Path to the saved file
         """
         output = Path(path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(svg_content, encoding="utf-8")
+        ensure_parent_dir(output)
+        write_utf8(output, svg_content)
         return output
 
 
@@ -58,8 +130,8 @@ class HTMLExporter:
         """
         html_content = HTMLExporter.wrap(svg_content, title, background)
         output = Path(path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(html_content, encoding="utf-8")
+        ensure_parent_dir(output)
+        write_utf8(output, html_content)
         return output
 
     @staticmethod
@@ -79,34 +151,12 @@ class HTMLExporter:
         Returns:
             HTML string
         """
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 20px;
-            background: {background};
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-        }}
-        svg {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-        }}
-    </style>
-</head>
-<body>
-{svg_content}
-</body>
-</html>"""
+        return _HTML_TEMPLATE.format(
+            title=title, background=background, svg_content=svg_content
+        )
+
+
+_B64_PREFIX = b"data:image/svg+xml;base64,"
 
 
 class Base64Exporter:
@@ -123,8 +173,8 @@ class Base64Exporter:
         Returns:
             Data URI string (data:image/svg+xml;base64,...)
         """
-        encoded = base64.b64encode(svg_content.encode("utf-8")).decode("ascii")
-        return f"data:image/svg+xml;base64,{encoded}"
+        # Concatenate as bytes and decode once
+        return (_B64_PREFIX + base64.b64encode(svg_content.encode("utf-8"))).decode("ascii")
 
     @staticmethod
     def to_img_tag(svg_content: str, alt: str = "SLATE Schematic") -> str:
@@ -156,11 +206,14 @@ class MarkdownExporter:
         Returns:
             SVG wrapped for Markdown compatibility
         """
-        # Strip XML declaration for inline use
-        content = svg_content
-        if content.startswith("<?xml"):
-            content = content[content.index("?>") + 2 :].strip()
-        return content
+        # Strip XML declaration for inline use; the declaration sits at the
+        # head, so search from just past "<?xml" and slice once
+        if svg_content[:5] != "<?xml":
+            return svg_content
+        end = svg_content.find("?>", 5)
+        if end == -1:
+            return svg_content
+        return svg_content[end + 2 :].strip()
 
     @staticmethod
     def to_link(
@@ -186,19 +239,19 @@ class JSONExporter:
     """Export diagram definition as JSON manifest."""
 
     @staticmethod
-    def to_manifest(
+    def to_manifest_bytes(
         svg_content: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> str:
+    ) -> bytes:
         """
-        Create a JSON manifest with SVG content and metadata.
+        Create a JSON manifest with SVG content and metadata, as UTF-8 bytes.
 
         Args:
             svg_content: SVG string
             metadata: Optional metadata dict
 
         Returns:
-            JSON string
+            UTF-8 encoded JSON
         """
         manifest = {
             "format": "svg",
@@ -208,7 +261,24 @@ class JSONExporter:
             "metadata": metadata or {},
             "content": svg_content,
         }
-        return json.dumps(manifest, indent=2)
+        return _dumps_bytes(manifest)
+
+    @staticmethod
+    def to_manifest(
+        svg_content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Create a JSON manifest with SVG content and metadata.
+
+        Args:
+            svg_content: SVG string
+            metadata: Optional metadata dict
+
+        Returns:
+            JSON string
+        """
+        return JSONExporter.to_manifest_bytes(svg_content, metadata).decode("utf-8")
 
     @staticmethod
     def to_file(
@@ -228,8 +298,7 @@ class JSONExporter:
             Path to saved file
         """
         output = Path(path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(
-            JSONExporter.to_manifest(svg_content, metadata), encoding="utf-8"
-        )
+        ensure_parent_dir(output)
+        with output.open("wb") as f:
+            f.write(JSONExporter.to_manifest_bytes(svg_content, metadata))
         return output
@@ -5,14 +5,35 @@ Automatic positioning algorithms for schematic components.
 Part of SLATE Generative UI protocols.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
+import functools
+from operator import attrgetter
 from typing import Dict, List, Literal, Tuple
 import math
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from .components import Component, Connection, SchematicConfig
 
 
+@functools.lru_cache(maxsize=1)
+def _load_compiled():
+    """Return the layout_numba kernel module, or None without numba.
+
+    Imported on first use: numba's import and cache load cost a few hundred
+    milliseconds, which small layouts never need to pay.
+    """
+    try:
+        from . import layout_numba
+    except ImportError:
+        return None
+    return layout_numba
+
+
 @dataclass
 class LayoutResult:
     """Result of layout calculation."""
@@ -20,10 +41,13 @@ class LayoutResult:
     bounds: Tuple[float, float, float, float]  # x, y, width, height
 
 
-class LayoutEngine(ABC):
-    """Abstract base class for layout algorithms."""
+class LayoutEngine:
+    """Base class for layout algorithms.
+
+    A plain class rather than an ABC, so constructing a layout per call
+    skips ABCMeta's instantiation checks.
+    """
 
-    @abstractmethod
     def calculate_positions(
         self,
         components: List[Component],
@@ -31,7 +55,7 @@ class LayoutEngine(ABC):
         config: SchematicConfig
     ) -> LayoutResult:
         """Calculate positions for all components."""
-        pass
+        raise NotImplementedError
 
 
 class HierarchicalLayout(LayoutEngine):
@@ -64,93 +88,236 @@ class HierarchicalLayout(LayoutEngine):
         if not components:
             return LayoutResult(positions={}, bounds=(0, 0, config.width, config.height))
 
-        # Group components by layer
-        layers: Dict[int, List[Component]] = {}
-        for comp in components:
-            layer = comp.layer
-            if layer not in layers:
-                layers[layer] = []
-            layers[layer].append(comp)
-
-        # Sort layers
-        sorted_layers = sorted(layers.keys())
+        # Sort once by layer (stable, so input order holds within a layer) and
+        # find where each layer's run starts; the final entry is the end
+        comps = sorted(components, key=attrgetter("layer"))
+        layer_keys = [c.layer for c in comps]
+        starts = [0]
+        starts.extend(i for i in range(1, len(comps)) if layer_keys[i] != layer_keys[i - 1])
+        starts.append(len(comps))
 
         # Calculate available space
         padding = config.padding
         available_width = config.width - (padding * 2)
         available_height = config.height - (padding * 2)
 
-        # Calculate layer positions
-        num_layers = len(sorted_layers)
-        if self.direction in ("TB", "BT"):
-            layer_height = available_height / max(num_layers, 1)
+        # Resolve the direction once: layers advance from layer_base by
+        # sign * layer_size along y (TB/BT) or x (LR/RL)
+        num_layers = len(starts) - 1
+        vertical = self.direction in ("TB", "BT")
+        sign = 1.0 if self.direction in ("TB", "LR") else -1.0
+        if vertical:
+            layer_size = available_height / max(num_layers, 1)
+            layer_base = padding if sign > 0 else config.height - padding
+            along_space = available_width
+            align = self.align
         else:
-            layer_width = available_width / max(num_layers, 1)
-
-        for layer_idx, layer_num in enumerate(sorted_layers):
-            layer_components = layers[layer_num]
+            layer_size = available_width / max(num_layers, 1)
+            layer_base = padding if sign > 0 else config.width - padding
+            along_space = available_height
+            align = "center"  # alignment only applies across TB/BT layers
+        layer_half = layer_size / 2
+        right_edge = config.width - padding
+        spacing = self.node_spacing
+
+        # Bounds are tracked per layer while placing nodes
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+
+        for layer_idx in range(num_layers):
+            layer_components = comps[starts[layer_idx]:starts[layer_idx + 1]]
             num_nodes = len(layer_components)
+            layer_coord = layer_base + sign * (layer_idx * layer_size + layer_half)
+
+            # Coordinates along the layer
+            if align == "left":
+                along = [
+                    padding + (node_idx * spacing) + (comp.size[0] / 2 if comp.size else 70)
+                    for node_idx, comp in enumerate(layer_components)
+                ]
+            elif align == "right":
+                along = [
+                    right_edge - ((num_nodes - 1 - node_idx) * spacing) - (comp.size[0] / 2 if comp.size else 70)
+                    for node_idx, comp in enumerate(layer_components)
+                ]
+            else:
+                pitch = along_space / num_nodes
+                half = pitch / 2
+                along = [padding + (node_idx * pitch) + half for node_idx in range(num_nodes)]
+
+            ids = [c.id for c in layer_components]
+            fixed = [layer_coord] * num_nodes
+            lo = min(along)
+            hi = max(along)
+            if vertical:
+                positions.update(zip(ids, zip(along, fixed)))
+                min_x, max_x = min(min_x, lo), max(max_x, hi)
+                min_y, max_y = min(min_y, layer_coord), max(max_y, layer_coord)
+            else:
+                positions.update(zip(ids, zip(fixed, along)))
+                min_x, max_x = min(min_x, layer_coord), max(max_x, layer_coord)
+                min_y, max_y = min(min_y, lo), max(max_y, hi)
 
-            for node_idx, comp in enumerate(layer_components):
-                if self.direction in ("TB", "BT"):
-                    # Top to bottom or bottom to top
-                    if self.direction == "TB":
-                        y = padding + (layer_idx * layer_height) + (layer_height / 2)
-                    else:
-                        y = config.height - padding - (layer_idx * layer_height) - (layer_height / 2)
-
-                    # Distribute nodes horizontally
-                    node_width = available_width / max(num_nodes, 1)
-                    x = padding + (node_idx * node_width) + (node_width / 2)
-
-                    # Apply alignment
-                    if self.align == "left":
-                        x = padding + (node_idx * self.node_spacing) + (comp.size[0] / 2 if comp.size else 70)
-                    elif self.align == "right":
-                        x = config.width - padding - ((num_nodes - 1 - node_idx) * self.node_spacing) - (comp.size[0] / 2 if comp.size else 70)
-                else:
-                    # Left to right or right to left
-                    if self.direction == "LR":
-                        x = padding + (layer_idx * layer_width) + (layer_width / 2)
-                    else:
-                        x = config.width - padding - (layer_idx * layer_width) - (layer_width / 2)
-
-                    # Distribute nodes vertically
-                    node_height = available_height / max(num_nodes, 1)
-                    y = padding + (node_idx * node_height) + (node_height / 2)
-
-                positions[comp.id] = (x, y)
-
-        # Calculate bounds
-        if positions:
-            xs = [p[0] for p in positions.values()]
-            ys = [p[1] for p in positions.values()]
-            bounds = (min(xs), min(ys), max(xs), max(ys))
-        else:
-            bounds = (0, 0, config.width, config.height)
+        bounds = (min_x, min_y, max_x, max_y)
 
         return LayoutResult(positions=positions, bounds=bounds)
 
 
+# Relative change in kinetic energy below which an iteration counts as flat
+_KE_REL_TOL = 1e-4
+
+
+@dataclass(slots=True)
+class _NodeArrays:
+    """Nodes being laid out as parallel per-axis lists indexed by ordinal."""
+    ids: List[str]
+    xs: List[float]
+    ys: List[float]
+    edges: List[Tuple[int, int]]
+    free: List[int]  # ordinals the simulation may move; the rest are pinned
+
+
+class _QuadNode:
+    """Square cell of a Barnes-Hut quadtree."""
+
+    __slots__ = ("x0", "y0", "size", "mass", "sx", "sy", "body", "children")
+
+    def __init__(self, x0: float, y0: float, size: float):
+        self.x0 = x0
+        self.y0 = y0
+        self.size = size
+        self.mass = 0
+        self.sx = 0.0  # sum of member x, for the center of mass
+        self.sy = 0.0
+        self.body = None  # index of the single member, -1 for a merged cell
+        self.children = None
+
+
+class _BarnesHutTree:
+    """
+    Quadtree over node positions for approximate all-pairs repulsion.
+
+    Distant cells are treated as one body at their center of mass, giving
+    O(N log N) work per iteration instead of O(N^2).
+    """
+
+    # Cells smaller than this merge coincident nodes instead of splitting
+    _MIN_SIZE = 1e-3
+
+    def __init__(self, xs: List[float], ys: List[float]):
+        self.xs = xs
+        self.ys = ys
+        x0, y0 = min(xs), min(ys)
+        size = max(max(xs) - x0, max(ys) - y0, self._MIN_SIZE) * 1.0001
+        self.root = _QuadNode(x0, y0, size)
+        for i in range(len(xs)):
+            self.insert(i, xs[i], ys[i])
+
+    @staticmethod
+    def _child(node: _QuadNode, x: float, y: float) -> _QuadNode:
+        half = node.size / 2
+        east = x >= node.x0 + half
+        south = y >= node.y0 + half
+        q = east + 2 * south
+        child = node.children[q]
+        if child is None:
+            child = _QuadNode(node.x0 + half * east, node.y0 + half * south, half)
+            node.children[q] = child
+        return child
+
+    def insert(self, i: int, x: float, y: float) -> None:
+        """Add node i at (x, y), subdividing occupied leaves."""
+        node = self.root
+        while True:
+            node.mass += 1
+            node.sx += x
+            node.sy += y
+            if node.children is None:
+                if node.mass == 1:
+                    node.body = i
+                    return
+                if node.size < self._MIN_SIZE:
+                    node.body = -1
+                    return
+                # Push the resident node down before descending
+                j = node.body
+                node.body = None
+                node.children = [None, None, None, None]
+                jx, jy = self.xs[j], self.ys[j]
+                child = self._child(node, jx, jy)
+                child.mass = 1
+                child.sx = jx
+                child.sy = jy
+                child.body = j
+            node = self._child(node, x, y)
+
+    def repulsion(self, i: int, strength: float, theta: float) -> Tuple[float, float]:
+        """Approximate repulsive force on node i from every other node."""
+        x = self.xs[i]
+        y = self.ys[i]
+        fx = fy = 0.0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.body == i:
+                continue
+            dx = node.sx / node.mass - x
+            dy = node.sy / node.mass - y
+            d2 = dx * dx + dy * dy + 1e-4
+            dist = math.sqrt(d2)
+            if node.children is None or node.size < theta * dist:
+                f = strength * node.mass / (d2 * dist)
+                fx -= f * dx
+                fy -= f * dy
+            else:
+                stack.extend(c for c in node.children if c is not None)
+        return fx, fy
+
+
 class ForceDirectedLayout(LayoutEngine):
     """
     Force-directed layout uses physics simulation.
     Best for: Network diagrams, integration maps.
+
+    Without NumPy, graphs of at least barnes_hut_min_nodes components use a
+    Barnes-Hut approximation (opening angle theta) for repulsion.
+
+    After min_iterations, the simulation stops early once the total kinetic
+    energy drops below tol or stays flat for two iterations; tol=0 always
+    runs every iteration.
+
+    Components with a preset position are pinned there: they still repel
+    and attract the others but never move. If every component is pinned,
+    no simulation runs.
     """
 
+    # Smaller graphs run a scalar loop; array setup and numba loading cost more
+    _VECTORIZE_MIN_NODES = 32
+    # Multithreaded numba repulsion does twice the pair work, so it only pays
+    # off on large graphs
+    _PARALLEL_MIN_NODES = 1024
+
     def __init__(
         self,
         iterations: int = 100,
         repulsion_strength: float = 500,
         attraction_strength: float = 0.1,
         center_gravity: float = 0.1,
-        damping: float = 0.9
+        damping: float = 0.9,
+        theta: float = 0.5,
+        barnes_hut_min_nodes: int = 256,
+        tol: float = 1e-3,
+        min_iterations: int = 10,
     ):
         self.iterations = iterations
         self.repulsion_strength = repulsion_strength
         self.attraction_strength = attraction_strength
         self.center_gravity = center_gravity
         self.damping = damping
+        self.theta = theta
+        self.barnes_hut_min_nodes = barnes_hut_min_nodes
+        self.tol = tol
+        self.min_iterations = min_iterations
 
     def calculate_positions(
         self,
@@ -162,92 +329,267 @@ class ForceDirectedLayout(LayoutEngine):
         if not components:
             return LayoutResult(positions={}, bounds=(0, 0, config.width, config.height))
 
-        # Initialize random positions
-        import random
-        random.seed(42)  # Reproducible layout
+        # Initialize random positions; a private generator keeps the layout
+        # reproducible without reseeding the global random module
+        uniform = random.Random(42).uniform
 
         center_x = config.width / 2
         center_y = config.height / 2
         radius = min(config.width, config.height) / 3
-
-        positions: Dict[str, List[float]] = {}
-        velocities: Dict[str, List[float]] = {}
-
+        step = 2 * math.pi / len(components)
+        cos = math.cos
+        sin = math.sin
+
+        ids = [c.id for c in components]
+        xs: List[float] = []
+        ys: List[float] = []
+        free: List[int] = []
         for i, comp in enumerate(components):
-            if comp.position:
-                positions[comp.id] = list(comp.position)
+            if comp.position is not None:
+                x, y = comp.position
+            else:
+                free.append(i)
+                angle = step * i
+                x = center_x + radius * cos(angle) * uniform(0.5, 1.0)
+                y = center_y + radius * sin(angle) * uniform(0.5, 1.0)
+            xs.append(x)
+            ys.append(y)
+
+        # Resolve edges to ordinals once, dropping any with an unknown endpoint
+        index = {comp_id: i for i, comp_id in enumerate(ids)}
+        edges = [
+            (index[c.from_node], index[c.to_node])
+            for c in connections
+            if c.from_node in index and c.to_node in index
+        ]
+
+        if not free:
+            return LayoutResult(
+                positions=dict(zip(ids, zip(xs, ys))),
+                bounds=(min(xs), min(ys), max(xs), max(ys)),
+            )
+
+        nodes = _NodeArrays(ids=ids, xs=xs, ys=ys, edges=edges, free=free)
+        padding = config.padding + 50
+
+        if np is None or len(components) < self._VECTORIZE_MIN_NODES:
+            return self._simulate_python(nodes, config, center_x, center_y, padding)
+        return self._simulate_numpy(nodes, config, center_x, center_y, padding)
+
+    def _simulate_python(
+        self,
+        nodes: _NodeArrays,
+        config: SchematicConfig,
+        center_x: float,
+        center_y: float,
+        padding: float,
+    ) -> LayoutResult:
+        """Run the simulation on the flat per-axis lists in nodes.
+
+        Used for small graphs, where array setup costs more than it saves,
+        and whenever NumPy is unavailable.
+        """
+        # Plain lists rather than array("d"): every array read boxes a new
+        # float, which made this loop about twice as slow when measured
+        ids, xs, ys, edges = nodes.ids, nodes.xs, nodes.ys, nodes.edges
+        free = nodes.free
+        n = len(ids)
+        vx = [0.0] * n
+        vy = [0.0] * n
+        fx = [0.0] * n
+        fy = [0.0] * n
+        zeros = [0.0] * n
+
+        sqrt = math.sqrt
+        repulsion = self.repulsion_strength
+        attraction = self.attraction_strength
+        gravity = self.center_gravity
+        damping = self.damping
+        theta = self.theta
+        hi_x = config.width - padding
+        hi_y = config.height - padding
+        use_tree = theta > 0 and n >= self.barnes_hut_min_nodes
+        tol = self.tol
+        min_iterations = self.min_iterations
+        prev_ke = 0.0
+        flat = 0
+
+        for it in range(self.iterations):
+            fx[:] = zeros
+            fy[:] = zeros
+
+            if use_tree:
+                # Approximate repulsion from a quadtree rebuilt each iteration
+                tree = _BarnesHutTree(xs, ys)
+                for i in range(n):
+                    fx[i], fy[i] = tree.repulsion(i, repulsion, theta)
             else:
-                angle = (2 * math.pi * i) / len(components)
-                x = center_x + radius * math.cos(angle) * random.uniform(0.5, 1.0)
-                y = center_y + radius * math.sin(angle) * random.uniform(0.5, 1.0)
-                positions[comp.id] = [x, y]
-            velocities[comp.id] = [0.0, 0.0]
-
-        # Build edge lookup
-        edges = [(c.from_node, c.to_node) for c in connections]
-
-        # Simulation loop
-        for _ in range(self.iterations):
-            forces: Dict[str, List[float]] = {c.id: [0.0, 0.0] for c in components}
-
-            # Repulsion between all nodes
-            for i, comp1 in enumerate(components):
-                for comp2 in components[i + 1:]:
-                    dx = positions[comp2.id][0] - positions[comp1.id][0]
-                    dy = positions[comp2.id][1] - positions[comp1.id][1]
-                    dist = math.sqrt(dx * dx + dy * dy) + 0.01
-
-                    force = self.repulsion_strength / (dist * dist)
-                    fx = force * dx / dist
-                    fy = force * dy / dist
-
-                    forces[comp1.id][0] -= fx
-                    forces[comp1.id][1] -= fy
-                    forces[comp2.id][0] += fx
-                    forces[comp2.id][1] += fy
+                # Repulsion between all nodes
+                for i in range(n):
+                    xi = xs[i]
+                    yi = ys[i]
+                    for j in range(i + 1, n):
+                        dx = xs[j] - xi
+                        dy = ys[j] - yi
+                        d2 = dx * dx + dy * dy + 1e-4
+                        inv = repulsion / (d2 * sqrt(d2))
+                        px = inv * dx
+                        py = inv * dy
+
+                        fx[i] -= px
+                        fy[i] -= py
+                        fx[j] += px
+                        fy[j] += py
+
+            # Attraction along edges; the spring force dist * k along
+            # dx / dist is simply k * dx
+            for a, b in edges:
+                px = attraction * (xs[b] - xs[a])
+                py = attraction * (ys[b] - ys[a])
+
+                fx[a] += px
+                fy[a] += py
+                fx[b] -= px
+                fy[b] -= py
+
+            # Center gravity, damping and bounds; pinned nodes keep zero
+            # velocity
+            ke = 0.0
+            for i in free:
+                vxi = vx[i] = (vx[i] + (fx[i] + (center_x - xs[i]) * gravity)) * damping
+                vyi = vy[i] = (vy[i] + (fy[i] + (center_y - ys[i]) * gravity)) * damping
+                ke += vxi * vxi + vyi * vyi
+                xs[i] = max(padding, min(hi_x, xs[i] + vxi))
+                ys[i] = max(padding, min(hi_y, ys[i] + vyi))
+
+            # Stop once settled
+            if tol > 0:
+                flat = flat + 1 if abs(prev_ke - ke) <= _KE_REL_TOL * prev_ke else 0
+                if it + 1 >= min_iterations and (ke < tol or flat >= 2):
+                    break
+                prev_ke = ke
+
+        result_positions = dict(zip(ids, zip(xs, ys)))
+        bounds = (min(xs), min(ys), max(xs), max(ys))
 
-            # Attraction along edges
-            for from_id, to_id in edges:
-                if from_id in positions and to_id in positions:
-                    dx = positions[to_id][0] - positions[from_id][0]
-                    dy = positions[to_id][1] - positions[from_id][1]
-                    dist = math.sqrt(dx * dx + dy * dy) + 0.01
+        return LayoutResult(positions=result_positions, bounds=bounds)
 
-                    force = dist * self.attraction_strength
-                    fx = force * dx / dist
-                    fy = force * dy / dist
+    def _simulate_numpy(
+        self,
+        nodes: _NodeArrays,
+        config: SchematicConfig,
+        center_x: float,
+        center_y: float,
+        padding: float,
+    ) -> LayoutResult:
+        """Run the simulation on (N, 2) arrays; same forces as _simulate_python.
+
+        Uses the numba kernel from layout_numba when numba is installed.
+        """
+        ids = nodes.ids
+        pos = np.empty((len(ids), 2))
+        pos[:, 0] = nodes.xs
+        pos[:, 1] = nodes.ys
+        vel = np.zeros_like(pos)
+        ef = np.array([a for a, _ in nodes.edges], dtype=np.intp)
+        et = np.array([b for _, b in nodes.edges], dtype=np.intp)
+        free = np.array(nodes.free, dtype=np.intp)
+
+        hi_x = config.width - padding
+        hi_y = config.height - padding
+
+        kernels = _load_compiled()
+        if kernels is not None:
+            parallel = len(ids) >= self._PARALLEL_MIN_NODES and kernels.parallel_available()
+            # Pass floats only so a single compiled specialization is reused
+            kernels.simulate(
+                pos, vel, ef, et, free, int(self.iterations),
+                float(self.repulsion_strength), float(self.attraction_strength),
+                float(self.center_gravity), float(self.damping),
+                float(center_x), float(center_y),
+                float(padding), float(hi_x), float(padding), float(hi_y),
+                float(self.tol), int(self.min_iterations), _KE_REL_TOL,
+                parallel,
+            )
+            return self._numpy_result(ids, pos)
+
+        center = np.array([center_x, center_y])
+        lo = np.array([padding, padding])
+        hi = np.array([hi_x, hi_y])
+
+        # Each unordered pair once (i < j), with scratch buffers reused by
+        # every iteration
+        n = len(ids)
+        pi, pj = np.triu_indices(n, k=1)
+        diff = np.empty((len(pi), 2))
+        other = np.empty_like(diff)
+        d2 = np.empty(len(pi))
+        inv = np.empty(len(pi))
+        forces = np.empty((n, 2))
+        # Pinned rows get no force, so their velocity stays zero; their
+        # positions are restored after clipping to bounds
+        pinned = np.setdiff1d(np.arange(n), free) if len(free) < n else None
+        if pinned is not None:
+            pinned_pos = pos[pinned]
+        tol = self.tol
+        prev_ke = 0.0
+        flat = 0
+
+        for it in range(self.iterations):
+            # Repulsion between all nodes: each pair force pushes j away from i
+            np.take(pos, pj, axis=0, out=diff)
+            np.take(pos, pi, axis=0, out=other)
+            diff -= other
+            np.einsum("ij,ij->i", diff, diff, out=d2)
+            d2 += 1e-4
+            np.sqrt(d2, out=inv)
+            inv *= d2
+            np.divide(self.repulsion_strength, inv, out=inv)
+            diff *= inv[:, None]
+            # bincount scatters with buffering, far faster than np.add.at
+            for axis in (0, 1):
+                forces[:, axis] = np.bincount(pj, diff[:, axis], n)
+                forces[:, axis] -= np.bincount(pi, diff[:, axis], n)
 
-                    forces[from_id][0] += fx
-                    forces[from_id][1] += fy
-                    forces[to_id][0] -= fx
-                    forces[to_id][1] -= fy
+            # Attraction along edges
+            if len(ef):
+                f = self.attraction_strength * (pos[et] - pos[ef])
+                for axis in (0, 1):
+                    forces[:, axis] += np.bincount(ef, f[:, axis], n)
+                    forces[:, axis] -= np.bincount(et, f[:, axis], n)
 
             # Center gravity
-            for comp in components:
-                dx = center_x - positions[comp.id][0]
-                dy = center_y - positions[comp.id][1]
-                forces[comp.id][0] += dx * self.center_gravity
-                forces[comp.id][1] += dy * self.center_gravity
-
-            # Apply forces with damping
-            for comp in components:
-                velocities[comp.id][0] = (velocities[comp.id][0] + forces[comp.id][0]) * self.damping
-                velocities[comp.id][1] = (velocities[comp.id][1] + forces[comp.id][1]) * self.damping
-                positions[comp.id][0] += velocities[comp.id][0]
-                positions[comp.id][1] += velocities[comp.id][1]
-
-                # Constrain to bounds
-                padding = config.padding + 50
-                positions[comp.id][0] = max(padding, min(config.width - padding, positions[comp.id][0]))
-                positions[comp.id][1] = max(padding, min(config.height - padding, positions[comp.id][1]))
-
-        # Convert to tuples
-        result_positions = {k: (v[0], v[1]) for k, v in positions.items()}
-
-        # Calculate bounds
-        xs = [p[0] for p in result_positions.values()]
-        ys = [p[1] for p in result_positions.values()]
-        bounds = (min(xs), min(ys), max(xs), max(ys))
+            forces += (center - pos) * self.center_gravity
+            if pinned is not None:
+                forces[pinned] = 0.0
+
+            # Apply forces with damping, then constrain to bounds
+            vel += forces
+            vel *= self.damping
+            pos += vel
+            np.clip(pos, lo, hi, out=pos)
+            if pinned is not None:
+                pos[pinned] = pinned_pos
+
+            # Stop once settled
+            if tol > 0:
+                ke = float(np.einsum("ij,ij->", vel, vel))
+                flat = flat + 1 if abs(prev_ke - ke) <= _KE_REL_TOL * prev_ke else 0
+                if it + 1 >= self.min_iterations and (ke < tol or flat >= 2):
+                    break
+                prev_ke = ke
+
+        return self._numpy_result(ids, pos)
+
+    @staticmethod
+    def _numpy_result(ids: List[str], pos: "np.ndarray") -> LayoutResult:
+        """Convert an (N, 2) position array back to a LayoutResult."""
+        result_positions = {
+            comp_id: (float(pos[i, 0]), float(pos[i, 1])) for i, comp_id in enumerate(ids)
+        }
+        mins = pos.min(axis=0)
+        maxs = pos.max(axis=0)
+        bounds = (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
 
         return LayoutResult(positions=result_positions, bounds=bounds)
 
@@ -258,6 +600,9 @@ class GridLayout(LayoutEngine):
     Best for: Component libraries, dashboards.
     """
 
+    # Below this many components the plain loop beats NumPy's setup cost
+    _NUMPY_MIN_NODES = 64
+
     def __init__(
         self,
         columns: int = 4,
@@ -284,6 +629,19 @@ class GridLayout(LayoutEngine):
 
         padding = config.padding
 
+        if np is not None and len(components) >= self._NUMPY_MIN_NODES:
+            idx = np.arange(len(components))
+            cols = idx % self.columns
+            rows = idx // self.columns
+            xs = padding + cols * (self.cell_width + self.gap) + self.cell_width / 2
+            ys = padding + rows * (self.cell_height + self.gap) + self.cell_height / 2
+            positions = dict(zip((c.id for c in components), zip(xs.tolist(), ys.tolist())))
+            bounds = (float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
+            return LayoutResult(positions=positions, bounds=bounds)
+
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+
         for idx, comp in enumerate(components):
             col = idx % self.columns
             row = idx // self.columns
@@ -292,11 +650,16 @@ class GridLayout(LayoutEngine):
             y = padding + (row * (self.cell_height + self.gap)) + (self.cell_height / 2)
 
             positions[comp.id] = (x, y)
-
-        # Calculate bounds
-        xs = [p[0] for p in positions.values()]
-        ys = [p[1] for p in positions.values()]
-        bounds = (min(xs), min(ys), max(xs), max(ys))
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+        bounds = (min_x, min_y, max_x, max_y)
 
         return LayoutResult(positions=positions, bounds=bounds)
 
@@ -0,0 +1,141 @@
+"""
+SLATE Schematic SDK - Compiled Layout Kernels
+
+Numba-compiled inner loops for the layout algorithms. Importing this
+module raises ImportError when numba is not installed; callers fall
+back to the NumPy or pure-Python implementations.
+"""
+
+import math
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+
+def parallel_available() -> bool:
+    """True when numba can run prange loops on more than one thread."""
+    return numba.get_num_threads() > 1
+
+
+@njit(cache=True, fastmath=True)
+def _repel_pairs(pos, forces, repulsion):
+    """Accumulate repulsion over each unordered pair once (serial)."""
+    n = pos.shape[0]
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = pos[j, 0] - pos[i, 0]
+            dy = pos[j, 1] - pos[i, 1]
+            d2 = dx * dx + dy * dy + 1e-4
+            inv = repulsion / (d2 * math.sqrt(d2))
+            fx = inv * dx
+            fy = inv * dy
+
+            forces[i, 0] -= fx
+            forces[i, 1] -= fy
+            forces[j, 0] += fx
+            forces[j, 1] += fy
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _repel_rows(pos, forces, repulsion):
+    """Accumulate repulsion row by row across threads.
+
+    Each row visits every other node and writes only its own force, so
+    threads never share an accumulator; this does twice the pair work of
+    _repel_pairs in exchange for running without locks.
+    """
+    n = pos.shape[0]
+    for i in prange(n):
+        fx = 0.0
+        fy = 0.0
+        for j in range(n):
+            dx = pos[j, 0] - pos[i, 0]
+            dy = pos[j, 1] - pos[i, 1]
+            d2 = dx * dx + dy * dy + 1e-4
+            inv = repulsion / (d2 * math.sqrt(d2))
+            fx -= inv * dx
+            fy -= inv * dy
+        forces[i, 0] += fx
+        forces[i, 1] += fy
+
+
+@njit(cache=True, fastmath=True)
+def simulate(pos, vel, ef, et, free, iterations, repulsion, attraction, gravity, damping,
+             center_x, center_y, lo_x, hi_x, lo_y, hi_y, tol, min_iterations, rel_tol,
+             parallel):
+    """
+    Run the force-directed simulation in place.
+
+    Args:
+        pos: (N, 2) float64 positions, updated in place
+        vel: (N, 2) float64 velocities, updated in place
+        ef: Edge source indices
+        et: Edge target indices
+        free: Indices of nodes that may move; the rest stay pinned
+        iterations: Number of simulation steps
+        repulsion: Node repulsion strength
+        attraction: Edge attraction strength
+        gravity: Pull toward (center_x, center_y)
+        damping: Velocity damping factor
+        center_x, center_y: Gravity center
+        lo_x, hi_x, lo_y, hi_y: Position bounds
+        tol: Stop when kinetic energy falls below this (0 disables stopping)
+        min_iterations: Iterations to run before stopping early
+        rel_tol: Relative kinetic energy change counted as flat
+        parallel: Spread repulsion across threads with _repel_rows
+
+    Returns:
+        Number of iterations run
+    """
+    forces = np.zeros_like(pos)
+    prev_ke = 0.0
+    flat = 0
+
+    for it in range(iterations):
+        forces[:, :] = 0.0
+
+        # Repulsion between all nodes
+        if parallel:
+            _repel_rows(pos, forces, repulsion)
+        else:
+            _repel_pairs(pos, forces, repulsion)
+
+        # Attraction along edges
+        for k in range(ef.shape[0]):
+            a = ef[k]
+            b = et[k]
+            dx = pos[b, 0] - pos[a, 0]
+            dy = pos[b, 1] - pos[a, 1]
+            fx = attraction * dx
+            fy = attraction * dy
+
+            forces[a, 0] += fx
+            forces[a, 1] += fy
+            forces[b, 0] -= fx
+            forces[b, 1] -= fy
+
+        # Center gravity, damping and bounds
+        ke = 0.0
+        for k in range(free.shape[0]):
+            i = free[k]
+            forces[i, 0] += (center_x - pos[i, 0]) * gravity
+            forces[i, 1] += (center_y - pos[i, 1]) * gravity
+
+            vel[i, 0] = (vel[i, 0] + forces[i, 0]) * damping
+            vel[i, 1] = (vel[i, 1] + forces[i, 1]) * damping
+            ke += vel[i, 0] * vel[i, 0] + vel[i, 1] * vel[i, 1]
+            pos[i, 0] = max(lo_x, min(hi_x, pos[i, 0] + vel[i, 0]))
+            pos[i, 1] = max(lo_y, min(hi_y, pos[i, 1] + vel[i, 1]))
+
+        # Stop once settled
+        if tol > 0:
+            if abs(prev_ke - ke) <= rel_tol * prev_ke:
+                flat += 1
+            else:
+                flat = 0
+            if it + 1 >= min_iterations and (ke < tol or flat >= 2):
+                return it + 1
+            prev_ke = ke
+
+    return iterations
@@ -8,6 +8,8 @@ system configurations. These can be used directly or as starting points
 for custom diagrams.
 """
 
+import functools
+import threading
 from typing import Dict, List, Tuple
 
 from .components import (
@@ -333,6 +335,37 @@ TEMPLATES: Dict[str, dict] = {
 }
 
 
+# Per-thread SchematicEngine per template, reset and reused by build_from_template
+_POOL = threading.local()
+
+
+def _pooled_engine(template_id: str, config: SchematicConfig):
+    """Return this thread's engine for template_id, emptied for reuse."""
+    from .engine import SchematicEngine
+
+    engines = getattr(_POOL, "engines", None)
+    if engines is None:
+        engines = _POOL.engines = {}
+
+    engine = engines.get(template_id)
+    if engine is None or engine.config is not config:
+        engine = engines[template_id] = SchematicEngine(config)
+    else:
+        engine.reset()
+    return engine
+
+
+@functools.lru_cache(maxsize=None)
+def _template_parts(template_id: str) -> Tuple[Tuple[Component, ...], Tuple[Connection, ...]]:
+    """Build a template's nodes once for build_from_template.
+
+    The factories return fresh, mutable objects for callers to edit; these
+    shared copies never leave this module and the engine only reads them.
+    """
+    components, connections = TEMPLATES[template_id]["factory"]()
+    return tuple(components), tuple(connections)
+
+
 def list_templates() -> List[Dict[str, str]]:
     """List available diagram templates."""
     return [
@@ -360,11 +393,9 @@ def build_from_template(template_id: str) -> str:
 
     template = TEMPLATES[template_id]
     config = template["config"]
-    components, connections = template["factory"]()
-
-    from .engine import SchematicEngine
+    components, connections = _template_parts(template_id)
 
-    engine = SchematicEngine(config)
+    engine = _pooled_engine(template_id, config)
     for comp in components:
         engine.add_node(comp)
     for conn in connections:
@@ -6,8 +6,10 @@ Part of SLATE Generative UI protocols.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
+import functools
 import html
+import io
 
 from .components import (
     Component, Connection, SchematicConfig,
@@ -16,67 +18,40 @@ from .components import (
 from .theme import ThemeManager, SchematicTheme
 
 
-class SVGRenderer:
-    """Renders schematic components to SVG."""
-
-    def __init__(self, theme_manager: ThemeManager):
-        self.theme = theme_manager.theme
-        self.tm = theme_manager
-
-    def render(
-        self,
-        components: List[Component],
-        connections: List[Connection],
-        positions: Dict[str, Tuple[float, float]],
-        config: SchematicConfig,
-        annotations: Optional[List[Annotation]] = None
-    ) -> str:
-        """Render complete SVG document."""
-        parts = [
-            self._render_header(config),
-            self._render_defs(config),
-            self._render_background(config),
-        ]
-
-        if config.show_grid:
-            parts.append(self._render_grid(config))
-
-        parts.append(self._render_connections(connections, positions, components))
-        parts.append(self._render_components(components, positions))
+@functools.lru_cache(maxsize=4096)
+def _escape(text: str) -> str:
+    """html.escape, memoized: the same labels recur across renders.
 
-        if annotations:
-            parts.append(self._render_annotations(annotations))
+    A single str.translate pass with a prebuilt table measured 2-4x slower
+    than html.escape's chained str.replace calls, so the latter is kept.
+    """
+    return html.escape(text)
 
-        if config.show_title:
-            parts.append(self._render_title(config))
 
-        if config.show_legend:
-            parts.append(self._render_legend(config))
-
-        if config.version_badge:
-            parts.append(self._render_version_badge(config))
+# Document head: XML declaration, <svg> root, defs and background, with the
+# grid overlay appended when shown
+_HEAD_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"
+     xmlns="http://www.w3.org/2000/svg"
+     role="img" aria-label="{title}">
+{defs}
 
-        parts.append(self._render_footer())
+  <!-- Background -->
+  <rect width="{width}" height="{height}" fill="url(#bgGradient)"/>'''
 
-        return "\n".join(parts)
+_HEAD_WITH_GRID_TEMPLATE = _HEAD_TEMPLATE + '''
 
-    def _render_header(self, config: SchematicConfig) -> str:
-        """Render SVG header."""
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{config.width}" height="{config.height}" viewBox="0 0 {config.width} {config.height}"
-     xmlns="http://www.w3.org/2000/svg"
-     role="img" aria-label="{html.escape(config.title)}">'''
+  <!-- Grid Overlay -->
+  <rect width="{width}" height="{height}" fill="url(#gridPattern)" opacity="0.5"/>'''
 
-    def _render_footer(self) -> str:
-        """Render SVG footer."""
-        return "</svg>"
 
-    def _render_defs(self, config: SchematicConfig) -> str:
-        """Render SVG definitions (gradients, filters, markers)."""
-        c = self.theme.colors
-        e = self.theme.effects
+@functools.lru_cache(maxsize=8)
+def _format_defs(theme: SchematicTheme) -> str:
+    """Format the <defs> block (gradients, filters, markers) for a theme."""
+    c = theme.colors
+    e = theme.effects
 
-        return f'''
+    return f'''
   <defs>
     <!-- Background Gradient -->
     <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
@@ -127,253 +102,401 @@ class SVGRenderer:
     </pattern>
   </defs>'''
 
-    def _render_background(self, config: SchematicConfig) -> str:
-        """Render background rectangle."""
-        return f'''
-  <!-- Background -->
-  <rect width="{config.width}" height="{config.height}" fill="url(#bgGradient)"/>'''
 
-    def _render_grid(self, config: SchematicConfig) -> str:
-        """Render grid overlay."""
-        return f'''
-  <!-- Grid Overlay -->
-  <rect width="{config.width}" height="{config.height}" fill="url(#gridPattern)" opacity="0.5"/>'''
+@functools.lru_cache(maxsize=8)
+def _format_legend_body(theme: SchematicTheme) -> str:
+    """Format the status legend entries; only their placement varies."""
+    c = theme.colors
+    t = theme.typography
 
-    def _render_components(
+    return f'''
+    <text x="0" y="0" font-family="{t.font_display}" font-size="{t.sublabel_size}" font-weight="{t.weight_semibold}" fill="{c.text_secondary}">Status</text>
+    <circle cx="8" cy="15" r="4" fill="{c.status_active}"/>
+    <text x="18" y="18" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Active</text>
+    <circle cx="8" cy="30" r="4" fill="{c.status_pending}"/>
+    <text x="18" y="33" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Pending</text>
+    <circle cx="8" cy="45" r="4" fill="{c.status_error}"/>
+    <text x="18" y="48" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Error</text>
+  </g>'''
+
+
+class SVGRenderer:
+    """Renders schematic components to SVG."""
+
+    # Dash attribute per connection style; solid lines have none
+    _DASH_MAP: Dict[ConnectionStyle, str] = {
+        ConnectionStyle.DASHED: 'stroke-dasharray="5,5"',
+        ConnectionStyle.DOTTED: 'stroke-dasharray="2,2"',
+    }
+
+    # Formatted component bodies kept per renderer before the memo is reset
+    _COMPONENT_BODY_CACHE_SIZE = 1024
+
+    def __init__(self, theme_manager: ThemeManager):
+        self.theme = theme_manager.theme
+        self.tm = theme_manager
+
+        # Theme-invariant attribute runs, formatted once and spliced into the
+        # per-component f-strings in place of several theme lookups each.
+        # The fragments themselves stay f-strings: the same markup as a
+        # str.format / format_map template measured twice as slow per call
+        c = self.theme.colors
+        t = self.theme.typography
+        e = self.theme.effects
+        wrap = "\n            "
+        label_font = (
+            f'font-family="{t.font_display}" font-size="{t.label_size}" '
+            f'font-weight="{t.weight_semibold}"'
+        )
+        self._label_attrs = f'{label_font}{wrap}fill="{c.text_primary}"'
+        self._muted_label_attrs = f'{label_font}{wrap}fill="{c.text_secondary}"'
+        self._sublabel_attrs = (
+            f'font-family="{t.font_mono}" font-size="{t.sublabel_size}"{wrap}'
+            f'fill="{c.text_secondary}"'
+        )
+        self._icon_attrs = f'font-family="{t.font_display}" font-size="14" fill="{c.primary}"'
+        self._radius_attr = f'rx="{e.radius_md}"'
+        self._external_attrs = f'rx="{e.radius_md}" fill="none" stroke="{c.text_muted}"'
+        self._title_attrs = (
+            f'font-family="{t.font_display}" font-size="{t.title_size}" '
+            f'font-weight="{t.weight_bold}"\n        fill="{c.text_primary}"'
+        )
+        self._badge_fill = f'fill="{c.primary}"'
+        self._badge_text_attrs = (
+            f'font-family="{t.font_display}" font-size="{t.badge_size}" '
+            f'font-weight="{t.weight_semibold}"\n          fill="#FFFFFF"'
+        )
+        # Font size, weight and color per annotation style; unknown styles
+        # render as labels
+        self._annotation_attrs = {
+            style: (
+                f'font-family="{t.font_display}" font-size="{size}" font-weight="{weight}"'
+                f'\n          fill="{color}"'
+            )
+            for style, (size, weight, color) in {
+                "title": (t.title_size, t.weight_bold, c.text_primary),
+                "subtitle": (t.subtitle_size, t.weight_semibold, c.text_secondary),
+                "label": (t.label_size, t.weight_regular, c.text_secondary),
+                "note": (t.label_size, t.weight_regular, c.text_muted),
+            }.items()
+        }
+
+        # Blocks that depend on nothing but the theme; themes are frozen and
+        # hashable, so renderers for equal themes share one formatted copy
+        self._defs = _format_defs(self.theme)
+        self._legend_body = _format_legend_body(self.theme)
+
+        # Component bodies are drawn around the origin and placed with a
+        # translate, so a component's markup is reused across positions
+        # and re-renders. A plain dict rather than an lru_cache over the
+        # bound method, which would tie the renderer into a reference cycle
+        self._component_bodies: Dict[tuple, str] = {}
+
+    def render(
         self,
         components: List[Component],
-        positions: Dict[str, Tuple[float, float]]
+        connections: List[Connection],
+        positions: Dict[str, Tuple[float, float]],
+        config: SchematicConfig,
+        annotations: Optional[List[Annotation]] = None
     ) -> str:
-        """Render all components."""
-        parts = ["\n  <!-- Components Layer -->", "  <g class=\"components-layer\" filter=\"url(#shadow)\">"]
+        """Render complete SVG document."""
+        buf = io.StringIO()
+        self._write_document(buf, components, connections, positions, config, annotations)
+        return buf.getvalue()
 
+    def render_bytes(
+        self,
+        components: List[Component],
+        connections: List[Connection],
+        positions: Dict[str, Tuple[float, float]],
+        config: SchematicConfig,
+        annotations: Optional[List[Annotation]] = None
+    ) -> bytes:
+        """Render complete SVG document as UTF-8 bytes.
+
+        Fragments are encoded as they are written, so the document is never
+        held as one str alongside its encoded copy.
+        """
+        raw = io.BytesIO()
+        buf = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        self._write_document(buf, components, connections, positions, config, annotations)
+        buf.flush()
+        buf.detach()
+        return raw.getvalue()
+
+    def _write_document(
+        self,
+        buf: TextIO,
+        components: List[Component],
+        connections: List[Connection],
+        positions: Dict[str, Tuple[float, float]],
+        config: SchematicConfig,
+        annotations: Optional[List[Annotation]]
+    ) -> None:
+        """Write the SVG document into buf."""
+        # Every fragment is written straight into one buffer; the sections
+        # are separated by newlines
+        write = buf.write
+
+        # Header, defs, background and grid in one format call
+        head = _HEAD_WITH_GRID_TEMPLATE if config.show_grid else _HEAD_TEMPLATE
+        write(head.format(
+            width=config.width, height=config.height,
+            title=_escape(config.title), defs=self._defs,
+        ))
+
+        # One pass over the components pairs each positioned component with
+        # its center and records the anchor its connections attach to: the
+        # center plus half the component's width. Positions without a
+        # component anchor at their center
+        anchors = {node_id: (x, y, 0) for node_id, (x, y) in positions.items()}
+        placed = []
         for comp in components:
-            if comp.id not in positions:
+            pos = positions.get(comp.id)
+            if pos is None:
                 continue
-            x, y = positions[comp.id]
-            parts.append(self._render_component(comp, x, y))
+            x, y = pos
+            size = comp.size
+            anchors[comp.id] = (x, y, size[0] / 2 if size else 0)
+            placed.append((comp, x, y))
 
-        parts.append("  </g>")
-        return "\n".join(parts)
+        write("\n")
+        self._render_connections(buf, connections, anchors)
+        write("\n")
+        self._render_components(buf, placed)
 
-    def _render_component(self, comp: Component, x: float, y: float) -> str:
-        """Render a single component."""
-        c = self.theme.colors
-        t = self.theme.typography
-        e = self.theme.effects
+        if annotations:
+            write("\n")
+            self._render_annotations(buf, annotations)
 
-        width = comp.size[0] if comp.size else 140
-        height = comp.size[1] if comp.size else 60
-        half_w = width / 2
-        half_h = height / 2
-
-        fill = self.tm.get_component_fill(comp.type.value)
-        border = self.tm.get_component_border(comp.type.value, comp.status.value)
-        status_color = self.tm.get_status_color(comp.status.value)
-
-        # Render based on component type
-        if comp.type == ComponentType.DATABASE:
-            return self._render_cylinder(comp, x, y, width, height, fill, border, status_color)
-        elif comp.type == ComponentType.GPU:
-            return self._render_hexagon(comp, x, y, width, height, fill, border, status_color)
-        elif comp.type == ComponentType.QUEUE:
-            return self._render_parallelogram(comp, x, y, width, height, fill, border, status_color)
-        elif comp.type == ComponentType.EXTERNAL:
-            return self._render_external(comp, x, y, width, height, border, status_color)
-        else:
-            # Default: rounded rectangle
-            return self._render_rounded_rect(comp, x, y, width, height, fill, border, status_color)
+        if config.show_title:
+            write("\n")
+            self._render_title(buf, config)
+
+        if config.show_legend:
+            write("\n")
+            self._render_legend(buf, config)
+
+        if config.version_badge:
+            write("\n")
+            self._render_version_badge(buf, config)
+
+        write("\n")
+        self._render_footer(buf)
+
+    def _render_footer(self, buf: TextIO) -> None:
+        """Render SVG footer."""
+        buf.write("</svg>")
+
+    def _render_components(
+        self,
+        buf: TextIO,
+        placed: List[Tuple[Component, float, float]]
+    ) -> None:
+        """Render all positioned components, given with their centers."""
+        write = buf.write
+        render_component = self._render_component
+        write("\n  <!-- Components Layer -->\n  <g class=\"components-layer\" filter=\"url(#shadow)\">")
+
+        for comp, x, y in placed:
+            write("\n")
+            render_component(buf, comp, x, y)
+
+        write("\n  </g>")
+
+    def _render_component(self, buf: TextIO, comp: Component, x: float, y: float) -> None:
+        """Render a single component, translated to its center."""
+        size = comp.size
+        width = size[0] if size else 140
+        height = size[1] if size else 60
+
+        # Enum .value goes through a descriptor, so read each one once
+        tm = self.tm
+        type_value = comp.type.value
+        status_value = comp.status.value
+        key = (
+            type_value, width, height,
+            tm.get_component_fill(type_value),
+            tm.get_component_border(type_value, status_value),
+            tm.get_status_color(status_value),
+            comp.label, comp.sublabel,
+        )
+        bodies = self._component_bodies
+        body = bodies.get(key)
+        if body is None:
+            if len(bodies) >= self._COMPONENT_BODY_CACHE_SIZE:
+                bodies.clear()
+            body = bodies[key] = self._format_component_body(*key)
+
+        buf.write(f'''
+    <g class="component" data-id="{comp.id}" data-type="{type_value}" transform="translate({x}, {y})">{body}
+    </g>''')
+
+    def _format_component_body(
+        self, type_value: str, width: float, height: float,
+        fill: str, border: str, status_color: str, label: str, sublabel: str
+    ) -> str:
+        """Format a component's shape and text centered on the origin.
+
+        Memoized per renderer in _component_bodies: the markup depends only
+        on these arguments, so repositioned or repeated components reuse it.
+        """
+        if type_value == ComponentType.DATABASE:
+            return self._render_cylinder(width, height, fill, border, status_color, label, sublabel)
+        if type_value == ComponentType.GPU:
+            return self._render_hexagon(width, height, fill, border, status_color, label, sublabel)
+        if type_value == ComponentType.QUEUE:
+            return self._render_parallelogram(width, height, fill, border, status_color, label)
+        if type_value == ComponentType.EXTERNAL:
+            return self._render_external(width, height, status_color, label)
+        # Default: rounded rectangle
+        return self._render_rounded_rect(
+            type_value, width, height, fill, border, status_color, label, sublabel
+        )
 
     def _render_rounded_rect(
-        self, comp: Component, x: float, y: float,
-        width: float, height: float, fill: str, border: str, status_color: str
+        self, type_value: str, width: float, height: float,
+        fill: str, border: str, status_color: str, label: str, sublabel: str
     ) -> str:
         """Render rounded rectangle component."""
-        c = self.theme.colors
-        t = self.theme.typography
-        e = self.theme.effects
-        rx = x - width / 2
-        ry = y - height / 2
-
-        # Status indicator
-        indicator = f'''
-      <circle cx="{rx + 12}" cy="{ry + 12}" r="5" fill="{status_color}"/>'''
+        rx = -width / 2
+        ry = -height / 2
 
         # AI icon for AI nodes
         icon = ""
-        if comp.type == ComponentType.AI:
+        if type_value == ComponentType.AI:
             icon = f'''
-      <text x="{rx + width - 15}" y="{ry + 18}" font-family="{t.font_display}" font-size="14" fill="{c.primary}">&#129504;</text>'''
+      <text x="{rx + width - 15}" y="{ry + 18}" {self._icon_attrs}>&#129504;</text>'''
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="{comp.type.value}">
       <rect x="{rx}" y="{ry}" width="{width}" height="{height}"
-            rx="{e.radius_md}" fill="{fill}" stroke="{border}" stroke-width="2"/>
-      {indicator}{icon}
-      <text x="{x}" y="{y - 2}" text-anchor="middle"
-            font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
-            fill="{c.text_primary}">{html.escape(comp.label)}</text>
-      <text x="{x}" y="{y + 14}" text-anchor="middle"
-            font-family="{t.font_mono}" font-size="{t.sublabel_size}"
-            fill="{c.text_secondary}">{html.escape(comp.sublabel)}</text>
-    </g>'''
+            {self._radius_attr} fill="{fill}" stroke="{border}" stroke-width="2"/>
+      <circle cx="{rx + 12}" cy="{ry + 12}" r="5" fill="{status_color}"/>{icon}
+      <text x="0" y="-2" text-anchor="middle"
+            {self._label_attrs}>{_escape(label)}</text>
+      <text x="0" y="14" text-anchor="middle"
+            {self._sublabel_attrs}>{_escape(sublabel)}</text>'''
 
     def _render_cylinder(
-        self, comp: Component, x: float, y: float,
-        width: float, height: float, fill: str, border: str, status_color: str
+        self, width: float, height: float,
+        fill: str, border: str, status_color: str, label: str, sublabel: str
     ) -> str:
         """Render cylinder (database) component."""
-        c = self.theme.colors
-        t = self.theme.typography
-        rx = x - width / 2
-        ry = y - height / 2
+        rx = -width / 2
         ellipse_ry = 10
+        # Each coordinate is used several times; compute it once
+        half_w = width / 2
+        top = -height / 2 + ellipse_ry
+        bottom = height / 2 - ellipse_ry
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="database">
       <!-- Cylinder body -->
-      <path d="M {rx} {ry + ellipse_ry}
-               L {rx} {ry + height - ellipse_ry}
-               A {width/2} {ellipse_ry} 0 0 0 {rx + width} {ry + height - ellipse_ry}
-               L {rx + width} {ry + ellipse_ry}
-               A {width/2} {ellipse_ry} 0 0 0 {rx} {ry + ellipse_ry}"
+      <path d="M {rx} {top}
+               L {rx} {bottom}
+               A {half_w} {ellipse_ry} 0 0 0 {half_w} {bottom}
+               L {half_w} {top}
+               A {half_w} {ellipse_ry} 0 0 0 {rx} {top}"
             fill="{fill}" stroke="{border}" stroke-width="2"/>
       <!-- Top ellipse -->
-      <ellipse cx="{x}" cy="{ry + ellipse_ry}" rx="{width/2}" ry="{ellipse_ry}"
+      <ellipse cx="0" cy="{top}" rx="{half_w}" ry="{ellipse_ry}"
                fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{rx + 12}" cy="{ry + ellipse_ry + 8}" r="4" fill="{status_color}"/>
-      <text x="{x}" y="{y + 5}" text-anchor="middle"
-            font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
-            fill="{c.text_primary}">{html.escape(comp.label)}</text>
-      <text x="{x}" y="{y + 20}" text-anchor="middle"
-            font-family="{t.font_mono}" font-size="{t.sublabel_size}"
-            fill="{c.text_secondary}">{html.escape(comp.sublabel)}</text>
-    </g>'''
+      <circle cx="{rx + 12}" cy="{top + 8}" r="4" fill="{status_color}"/>
+      <text x="0" y="5" text-anchor="middle"
+            {self._label_attrs}>{_escape(label)}</text>
+      <text x="0" y="20" text-anchor="middle"
+            {self._sublabel_attrs}>{_escape(sublabel)}</text>'''
 
     def _render_hexagon(
-        self, comp: Component, x: float, y: float,
-        width: float, height: float, fill: str, border: str, status_color: str
+        self, width: float, height: float,
+        fill: str, border: str, status_color: str, label: str, sublabel: str
     ) -> str:
         """Render hexagon (GPU) component."""
-        c = self.theme.colors
-        t = self.theme.typography
-        # Hexagon points
+        # Hexagon points; each vertex coordinate is shared by two points
         hw = width / 2
         hh = height / 2
-        indent = width * 0.2
-        points = f"{x - hw + indent},{y - hh} {x + hw - indent},{y - hh} {x + hw},{y} {x + hw - indent},{y + hh} {x - hw + indent},{y + hh} {x - hw},{y}"
+        inner = hw - width * 0.2
+        points = f"{-inner},{-hh} {inner},{-hh} {hw},0 {inner},{hh} {-inner},{hh} {-hw},0"
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="gpu">
       <polygon points="{points}" fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{x - hw + indent + 10}" cy="{y - hh + 12}" r="4" fill="{status_color}"/>
-      <text x="{x}" y="{y - 2}" text-anchor="middle"
-            font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
-            fill="{c.text_primary}">{html.escape(comp.label)}</text>
-      <text x="{x}" y="{y + 14}" text-anchor="middle"
-            font-family="{t.font_mono}" font-size="{t.sublabel_size}"
-            fill="{c.text_secondary}">{html.escape(comp.sublabel)}</text>
-    </g>'''
+      <circle cx="{10 - inner}" cy="{12 - hh}" r="4" fill="{status_color}"/>
+      <text x="0" y="-2" text-anchor="middle"
+            {self._label_attrs}>{_escape(label)}</text>
+      <text x="0" y="14" text-anchor="middle"
+            {self._sublabel_attrs}>{_escape(sublabel)}</text>'''
 
     def _render_parallelogram(
-        self, comp: Component, x: float, y: float,
-        width: float, height: float, fill: str, border: str, status_color: str
+        self, width: float, height: float,
+        fill: str, border: str, status_color: str, label: str
     ) -> str:
         """Render parallelogram (queue) component."""
-        c = self.theme.colors
-        t = self.theme.typography
         hw = width / 2
         hh = height / 2
         skew = 15
-        points = f"{x - hw + skew},{y - hh} {x + hw + skew},{y - hh} {x + hw - skew},{y + hh} {x - hw - skew},{y + hh}"
+        top_left = skew - hw
+        points = f"{top_left},{-hh} {hw + skew},{-hh} {hw - skew},{hh} {-hw - skew},{hh}"
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="queue">
       <polygon points="{points}" fill="{fill}" stroke="{border}" stroke-width="2"/>
-      <circle cx="{x - hw + skew + 10}" cy="{y - hh + 10}" r="4" fill="{status_color}"/>
-      <text x="{x}" y="{y + 4}" text-anchor="middle"
-            font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
-            fill="{c.text_primary}">{html.escape(comp.label)}</text>
-    </g>'''
+      <circle cx="{top_left + 10}" cy="{10 - hh}" r="4" fill="{status_color}"/>
+      <text x="0" y="4" text-anchor="middle"
+            {self._label_attrs}>{_escape(label)}</text>'''
 
     def _render_external(
-        self, comp: Component, x: float, y: float,
-        width: float, height: float, border: str, status_color: str
+        self, width: float, height: float, status_color: str, label: str
     ) -> str:
         """Render external service (dashed border)."""
-        c = self.theme.colors
-        t = self.theme.typography
-        e = self.theme.effects
-        rx = x - width / 2
-        ry = y - height / 2
+        rx = -width / 2
+        ry = -height / 2
 
         return f'''
-    <g class="component" data-id="{comp.id}" data-type="external">
       <rect x="{rx}" y="{ry}" width="{width}" height="{height}"
-            rx="{e.radius_md}" fill="none" stroke="{c.text_muted}" stroke-width="2" stroke-dasharray="5,5"/>
+            {self._external_attrs} stroke-width="2" stroke-dasharray="5,5"/>
       <circle cx="{rx + 12}" cy="{ry + 12}" r="4" fill="{status_color}"/>
-      <text x="{x}" y="{y}" text-anchor="middle"
-            font-family="{t.font_display}" font-size="{t.label_size}" font-weight="{t.weight_semibold}"
-            fill="{c.text_secondary}">{html.escape(comp.label)}</text>
-    </g>'''
+      <text x="0" y="0" text-anchor="middle"
+            {self._muted_label_attrs}>{_escape(label)}</text>'''
 
     def _render_connections(
         self,
+        buf: TextIO,
         connections: List[Connection],
-        positions: Dict[str, Tuple[float, float]],
-        components: List[Component]
-    ) -> str:
-        """Render all connections."""
-        parts = ["\n  <!-- Connections Layer -->", "  <g class=\"connections-layer\">"]
+        anchors: Dict[str, Tuple[float, float, float]]
+    ) -> None:
+        """Render all connections between anchored nodes.
 
-        # Create component lookup for sizes
-        comp_lookup = {c.id: c for c in components}
+        Connections leave from the right edge of a sized component and
+        enter at the left edge; anchors maps node ids to (x, y, half_width).
+        """
+        write = buf.write
+        render_connection = self._render_connection
+        write("\n  <!-- Connections Layer -->\n  <g class=\"connections-layer\">")
 
         for conn in connections:
-            if conn.from_node not in positions or conn.to_node not in positions:
+            start = anchors.get(conn.from_node)
+            end = anchors.get(conn.to_node)
+            if start is None or end is None:
                 continue
 
-            from_pos = positions[conn.from_node]
-            to_pos = positions[conn.to_node]
-
-            # Adjust endpoints based on component sizes
-            from_comp = comp_lookup.get(conn.from_node)
-            to_comp = comp_lookup.get(conn.to_node)
-
-            from_x, from_y = from_pos
-            to_x, to_y = to_pos
+            from_x, from_y, from_hw = start
+            to_x, to_y, to_hw = end
 
-            # Offset from component edge
-            if from_comp and from_comp.size:
-                from_x += from_comp.size[0] / 2
-            if to_comp and to_comp.size:
-                to_x -= to_comp.size[0] / 2
+            write("\n")
+            render_connection(buf, conn, from_x + from_hw, from_y, to_x - to_hw, to_y)
 
-            parts.append(self._render_connection(conn, from_x, from_y, to_x, to_y))
-
-        parts.append("  </g>")
-        return "\n".join(parts)
+        write("\n  </g>")
 
     def _render_connection(
-        self, conn: Connection,
+        self, buf: TextIO, conn: Connection,
         x1: float, y1: float, x2: float, y2: float
-    ) -> str:
+    ) -> None:
         """Render a single connection."""
-        c = self.theme.colors
-        t = self.theme.typography
-
-        color = conn.color_override or c.connection_default
+        color = conn.color_override or self.theme.colors.connection_default
         marker = "arrowhead"
-        stroke_dasharray = ""
-
-        if conn.style == ConnectionStyle.DASHED:
-            stroke_dasharray = 'stroke-dasharray="5,5"'
-        elif conn.style == ConnectionStyle.DOTTED:
-            stroke_dasharray = 'stroke-dasharray="2,2"'
+        stroke_dasharray = self._DASH_MAP.get(conn.style, "")
 
         # Create curved path for better aesthetics
         mid_x = (x1 + x2) / 2
-        ctrl_offset = abs(y2 - y1) * 0.3
 
         path = f"M {x1} {y1} C {mid_x} {y1}, {mid_x} {y2}, {x2} {y2}"
 
@@ -383,89 +506,55 @@ class SVGRenderer:
             label_y = (y1 + y2) / 2 - 8
             label_part = f'''
       <text x="{label_x}" y="{label_y}" text-anchor="middle"
-            font-family="{t.font_mono}" font-size="{t.sublabel_size}"
-            fill="{c.text_secondary}">{html.escape(conn.label)}</text>'''
+            {self._sublabel_attrs}>{_escape(conn.label)}</text>'''
 
-        return f'''
+        buf.write(f'''
     <g class="connection" data-from="{conn.from_node}" data-to="{conn.to_node}">
       <path d="{path}" fill="none" stroke="{color}" stroke-width="2"
             marker-end="url(#{marker})" {stroke_dasharray}/>
       {label_part}
-    </g>'''
+    </g>''')
 
-    def _render_title(self, config: SchematicConfig) -> str:
+    def _render_title(self, buf: TextIO, config: SchematicConfig) -> None:
         """Render diagram title."""
-        c = self.theme.colors
-        t = self.theme.typography
-
-        return f'''
+        buf.write(f'''
   <!-- Title -->
   <text x="{config.padding}" y="{config.padding + 5}"
-        font-family="{t.font_display}" font-size="{t.title_size}" font-weight="{t.weight_bold}"
-        fill="{c.text_primary}">{html.escape(config.title)}</text>'''
+        {self._title_attrs}>{_escape(config.title)}</text>''')
 
-    def _render_legend(self, config: SchematicConfig) -> str:
+    def _render_legend(self, buf: TextIO, config: SchematicConfig) -> None:
         """Render status legend."""
-        c = self.theme.colors
-        t = self.theme.typography
-
         legend_x = config.width - 150
         legend_y = config.height - 80
 
-        return f'''
+        buf.write(f'''
   <!-- Legend -->
-  <g class="legend" transform="translate({legend_x}, {legend_y})">
-    <text x="0" y="0" font-family="{t.font_display}" font-size="{t.sublabel_size}" font-weight="{t.weight_semibold}" fill="{c.text_secondary}">Status</text>
-    <circle cx="8" cy="15" r="4" fill="{c.status_active}"/>
-    <text x="18" y="18" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Active</text>
-    <circle cx="8" cy="30" r="4" fill="{c.status_pending}"/>
-    <text x="18" y="33" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Pending</text>
-    <circle cx="8" cy="45" r="4" fill="{c.status_error}"/>
-    <text x="18" y="48" font-family="{t.font_mono}" font-size="{t.sublabel_size}" fill="{c.text_secondary}">Error</text>
-  </g>'''
+  <g class="legend" transform="translate({legend_x}, {legend_y})">''')
+        buf.write(self._legend_body)
 
-    def _render_version_badge(self, config: SchematicConfig) -> str:
+    def _render_version_badge(self, buf: TextIO, config: SchematicConfig) -> None:
         """Render version badge."""
-        c = self.theme.colors
-        t = self.theme.typography
-
         badge_x = config.width - 110
         badge_y = config.padding
 
-        return f'''
+        buf.write(f'''
   <!-- Version Badge -->
   <g class="version-badge">
-    <rect x="{badge_x}" y="{badge_y}" width="90" height="24" rx="12" fill="{c.primary}"/>
+    <rect x="{badge_x}" y="{badge_y}" width="90" height="24" rx="12" {self._badge_fill}/>
     <text x="{badge_x + 45}" y="{badge_y + 16}" text-anchor="middle"
-          font-family="{t.font_display}" font-size="{t.badge_size}" font-weight="{t.weight_semibold}"
-          fill="#FFFFFF">{html.escape(config.version_badge)}</text>
-  </g>'''
+          {self._badge_text_attrs}>{_escape(config.version_badge)}</text>
+  </g>''')
 
-    def _render_annotations(self, annotations: List[Annotation]) -> str:
+    def _render_annotations(self, buf: TextIO, annotations: List[Annotation]) -> None:
         """Render text annotations."""
-        c = self.theme.colors
-        t = self.theme.typography
-        parts = ["\n  <!-- Annotations Layer -->", "  <g class=\"annotations-layer\">"]
-
-        for ann in annotations:
-            size = t.label_size
-            weight = t.weight_regular
-            color = c.text_secondary
-
-            if ann.style == "title":
-                size = t.title_size
-                weight = t.weight_bold
-                color = c.text_primary
-            elif ann.style == "subtitle":
-                size = t.subtitle_size
-                weight = t.weight_semibold
-            elif ann.style == "note":
-                color = c.text_muted
-
-            parts.append(f'''
-    <text x="{ann.position[0]}" y="{ann.position[1]}" text-anchor="{ann.anchor}"
-          font-family="{t.font_display}" font-size="{size}" font-weight="{weight}"
-          fill="{color}">{html.escape(ann.text)}</text>''')
+        styles = self._annotation_attrs
+        default = styles["label"]
+        buf.write("\n  <!-- Annotations Layer -->\n  <g class=\"annotations-layer\">")
+        buf.write("".join(
+            f'''
 
-        parts.append("  </g>")
-        return "\n".join(parts)
+    <text x="{ann.position[0]}" y="{ann.position[1]}" text-anchor="{ann.anchor}"
+          {styles.get(ann.style, default)}>{_escape(ann.text)}</text>'''
+            for ann in annotations
+        ))
+        buf.write("\n  </g>")
@@ -5,17 +5,12 @@ Integrates with locked design tokens (v3.0.0) for consistent theming.
 Part of SLATE Generative UI protocols.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, Literal
-import sys
-from pathlib import Path
+import functools
 
-# Add workspace root for imports
-WORKSPACE_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(WORKSPACE_ROOT))
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchematicColors:
     """Color palette for schematic rendering."""
     # Background
@@ -70,7 +65,7 @@ class SchematicColors:
     connection_muted: str = "#6B7280"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchematicTypography:
     """Typography settings for schematic rendering."""
     font_display: str = "'Segoe UI', 'Inter', system-ui, sans-serif"
@@ -89,7 +84,7 @@ class SchematicTypography:
     weight_regular: int = 400
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchematicEffects:
     """Visual effects for schematic rendering."""
     # Shadow
@@ -108,7 +103,7 @@ class SchematicEffects:
     radius_lg: int = 12
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchematicTheme:
     """Complete theme configuration for schematics."""
     name: str = "blueprint"
@@ -117,6 +112,10 @@ class SchematicTheme:
     effects: SchematicEffects = field(default_factory=SchematicEffects)
 
 
+# Fields a theme's overrides may set
+_COLOR_FIELDS = frozenset(f.name for f in fields(SchematicColors))
+
+
 class ThemeManager:
     """Manages schematic themes and integrates with design tokens."""
 
@@ -149,57 +148,69 @@ class ThemeManager:
         self.theme_name = theme_name
         self.theme = self._build_theme(theme_name)
 
+        # Color lookups, built once rather than per component
+        c = self.theme.colors
+        self._status_colors: Dict[str, str] = {
+            "active": c.status_active,
+            "pending": c.status_pending,
+            "error": c.status_error,
+            "inactive": c.status_inactive,
+        }
+        self._fill_colors: Dict[str, str] = {
+            "service": c.service_fill,
+            "database": c.database_fill,
+            "gpu": c.gpu_fill,
+            "ai": c.ai_fill,
+            "api": c.api_fill,
+            "queue": c.queue_fill,
+            "external": c.external_fill,
+        }
+        # Active components are outlined in the primary color
+        self._border_colors: Dict[str, str] = {**self._status_colors, "active": c.primary}
+
     def _build_theme(self, theme_name: str) -> SchematicTheme:
         """Build theme from name, applying overrides."""
-        colors = SchematicColors()
-        typography = SchematicTypography()
-        effects = SchematicEffects()
-
-        # Apply theme-specific overrides
-        if theme_name in self.THEMES:
-            overrides = self.THEMES[theme_name]
-            for key, value in overrides.items():
-                if hasattr(colors, key):
-                    setattr(colors, key, value)
+        # Apply theme-specific overrides in the constructor; colors are frozen
+        overrides = self.THEMES.get(theme_name, {})
+        colors = SchematicColors(
+            **{key: value for key, value in overrides.items() if key in _COLOR_FIELDS}
+        )
 
         return SchematicTheme(
             name=theme_name,
             colors=colors,
-            typography=typography,
-            effects=effects
+            typography=SchematicTypography(),
+            effects=SchematicEffects()
         )
 
     def get_status_color(self, status: str) -> str:
         """Get color for component status."""
-        status_map = {
-            "active": self.theme.colors.status_active,
-            "pending": self.theme.colors.status_pending,
-            "error": self.theme.colors.status_error,
-            "inactive": self.theme.colors.status_inactive,
-        }
-        return status_map.get(status, self.theme.colors.status_inactive)
+        return self._status_colors.get(status, self.theme.colors.status_inactive)
 
     def get_component_fill(self, component_type: str) -> str:
         """Get fill color for component type."""
-        fill_map = {
-            "service": self.theme.colors.service_fill,
-            "database": self.theme.colors.database_fill,
-            "gpu": self.theme.colors.gpu_fill,
-            "ai": self.theme.colors.ai_fill,
-            "api": self.theme.colors.api_fill,
-            "queue": self.theme.colors.queue_fill,
-            "external": self.theme.colors.external_fill,
-        }
-        return fill_map.get(component_type, self.theme.colors.surface_container)
+        return self._fill_colors.get(component_type, self.theme.colors.surface_container)
 
     def get_component_border(self, component_type: str, status: str = "active") -> str:
         """Get border color for component."""
-        if status == "active":
-            return self.theme.colors.primary
-        return self.get_status_color(status)
+        return self._border_colors.get(status, self.theme.colors.status_inactive)
+
+
+# Shared theme instances for convenience; themes are frozen, so one built
+# instance per name serves every caller
+@functools.lru_cache(maxsize=1)
+def BlueprintTheme() -> SchematicTheme:
+    """Return the shared blueprint theme."""
+    return ThemeManager("blueprint").theme
+
+
+@functools.lru_cache(maxsize=1)
+def DarkTheme() -> SchematicTheme:
+    """Return the shared dark theme."""
+    return ThemeManager("dark").theme
 
 
-# Pre-instantiated themes for convenience
-BlueprintTheme = lambda: ThemeManager("blueprint").theme
-DarkTheme = lambda: ThemeManager("dark").theme
-LightTheme = lambda: ThemeManager("light").theme
+@functools.lru_cache(maxsize=1)
+def LightTheme() -> SchematicTheme:
+    """Return the shared light theme."""
+    return ThemeManager("light").theme
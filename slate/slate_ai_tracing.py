@@ -27,17 +27,22 @@ Usage:
     python slate/slate_ai_tracing.py --report        # Generate trace report
     python slate/slate_ai_tracing.py --export json   # Export all traces to JSON
     python slate/slate_ai_tracing.py --reset          # Clear trace history
+    python slate/slate_ai_tracing.py --rebuild        # Rebuild metrics from trace files
 """
 
 import argparse
+import atexit
 import json
 import os
+import queue
 import subprocess
 import sys
 import statistics
+import threading
 import time
+from array import array
 from collections import defaultdict
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -69,9 +74,57 @@ try:
 except ImportError:
     pass
 
+# orjson parses trace lines several times faster than json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NVML bindings (nvidia-ml-py) — graceful import; nvidia-smi is the fallback
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
 
 # ── Data Classes ────────────────────────────────────────────────────────
 
+# Recent samples kept per model for percentiles and average tok/s
+SAMPLE_WINDOW = 1000
+
+
+class SampleWindow:
+    """
+    Fixed-size ring of the most recent float samples, oldest first.
+
+    Samples are stored as float32 in one array('f'): 4 bytes each instead of
+    a float object plus a pointer, ample precision for latencies rounded to
+    0.1 ms and for tok/s.
+    """
+
+    __slots__ = ("_buf", "_next", "_full")
+
+    def __init__(self, size: int = SAMPLE_WINDOW):
+        self._buf = array("f", bytes(4 * size))
+        self._next = 0
+        self._full = False
+
+    def append(self, value: float):
+        self._buf[self._next] = value
+        self._next += 1
+        if self._next == len(self._buf):
+            self._next = 0
+            self._full = True
+
+    def __len__(self) -> int:
+        return len(self._buf) if self._full else self._next
+
+    def __iter__(self):
+        if self._full:
+            yield from self._buf[self._next:]
+        yield from self._buf[:self._next]
+
+
 @dataclass
 class InferenceTrace:
     """Single inference trace record."""
@@ -98,19 +151,30 @@ class InferenceTrace:
     max_tokens: int = 2048
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Every field is a primitive, so a shallow copy matches asdict()
+        # without its recursive deepcopy
+        return self.__dict__.copy()
 
 
 @dataclass
 class ModelMetrics:
-    """Aggregated metrics for a single model."""
+    """Aggregated metrics for a single model.
+
+    Totals cover every call; latency percentiles and average tok/s cover
+    only the recent samples kept in latencies_ms/tokens_per_sec_values,
+    which are not persisted.
+    """
     model: str
     total_calls: int = 0
     total_tokens: int = 0
     total_latency_ms: float = 0.0
     error_count: int = 0
-    latencies_ms: list = field(default_factory=list)
-    tokens_per_sec_values: list = field(default_factory=list)
+    latencies_ms: SampleWindow = field(default_factory=SampleWindow)
+    tokens_per_sec_values: SampleWindow = field(default_factory=SampleWindow)
+    # (p50, p95, p99) of latencies_ms, recomputed on the next percentile read
+    # after _dirty is set; code that appends to latencies_ms sets _dirty
+    _percentile_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
 
     @property
     def avg_latency_ms(self) -> float:
@@ -122,33 +186,44 @@ class ModelMetrics:
             return 0.0
         return statistics.mean(self.tokens_per_sec_values)
 
+    def _percentiles(self) -> tuple[float, float, float]:
+        """Return (p50, p95, p99) latency from one sorted snapshot.
+
+        A full sort is kept over numpy.partition: with the history capped
+        at 1000 samples, partition only breaks even near the cap and is
+        slower below it, and numpy is not a dependency of this module.
+        """
+        if not self._dirty and self._percentile_cache is not None:
+            return self._percentile_cache
+        if not self.latencies_ms:
+            return 0.0, 0.0, 0.0
+        s = sorted(self.latencies_ms)
+        n = len(s)
+        mid = n // 2
+        p50 = s[mid] if n % 2 else (s[mid - 1] + s[mid]) / 2
+        # n * k // 100 < n for k < 100, so the indices need no clamping
+        self._percentile_cache = (p50, s[n * 95 // 100], s[n * 99 // 100])
+        self._dirty = False
+        return self._percentile_cache
+
     @property
     def p50_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        return statistics.median(self.latencies_ms)
+        return self._percentiles()[0]
 
     @property
     def p95_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        sorted_l = sorted(self.latencies_ms)
-        idx = int(len(sorted_l) * 0.95)
-        return sorted_l[min(idx, len(sorted_l) - 1)]
+        return self._percentiles()[1]
 
     @property
     def p99_latency_ms(self) -> float:
-        if not self.latencies_ms:
-            return 0.0
-        sorted_l = sorted(self.latencies_ms)
-        idx = int(len(sorted_l) * 0.99)
-        return sorted_l[min(idx, len(sorted_l) - 1)]
+        return self._percentiles()[2]
 
     @property
     def error_rate(self) -> float:
         return self.error_count / max(self.total_calls, 1)
 
     def to_dict(self) -> dict:
+        p50, p95, p99 = self._percentiles()
         return {
             "model": self.model,
             "total_calls": self.total_calls,
@@ -156,17 +231,69 @@ class ModelMetrics:
             "error_count": self.error_count,
             "error_rate": round(self.error_rate, 4),
             "avg_latency_ms": round(self.avg_latency_ms, 1),
-            "p50_latency_ms": round(self.p50_latency_ms, 1),
-            "p95_latency_ms": round(self.p95_latency_ms, 1),
-            "p99_latency_ms": round(self.p99_latency_ms, 1),
+            "p50_latency_ms": round(p50, 1),
+            "p95_latency_ms": round(p95, 1),
+            "p99_latency_ms": round(p99, 1),
             "avg_tokens_per_sec": round(self.avg_tokens_per_sec, 1),
         }
 
 
 # ── GPU Snapshot ────────────────────────────────────────────────────────
 
+_nvml_ready: Optional[bool] = None
+_nvml_handles: dict[int, Any] = {}
+
+
+def _nvml_snapshot(gpu_index: int) -> Optional[dict]:
+    """GPU snapshot through NVML, or None when NVML cannot answer."""
+    global _nvml_ready
+    if pynvml is None:
+        return None
+    if _nvml_ready is None:
+        try:
+            pynvml.nvmlInit()
+            _nvml_ready = True
+        except Exception:
+            _nvml_ready = False
+    if not _nvml_ready:
+        return None
+    try:
+        handle = _nvml_handles.get(gpu_index)
+        if handle is None:
+            handle = _nvml_handles[gpu_index] = pynvml.nvmlDeviceGetHandleByIndex(gpu_index)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+    except Exception:
+        return None
+    return {
+        "gpu_index": gpu_index,
+        "memory_used_mb": mem.used // (1024 * 1024),
+        "memory_total_mb": mem.total // (1024 * 1024),
+        "utilization_pct": util.gpu,
+    }
+
+
+# Snapshots are reused for this long, so bursts of inferences share one read
+GPU_SNAPSHOT_TTL_S = 0.1
+_gpu_cache: dict[int, tuple[float, dict]] = {}
+
+
 def get_gpu_snapshot(gpu_index: int = 0) -> dict:
-    """Get current GPU memory usage snapshot."""
+    """Get current GPU memory usage snapshot, at most GPU_SNAPSHOT_TTL_S old."""
+    now = time.monotonic()
+    cached = _gpu_cache.get(gpu_index)
+    if cached is not None and now - cached[0] < GPU_SNAPSHOT_TTL_S:
+        return dict(cached[1])
+    snapshot = _read_gpu_snapshot(gpu_index)
+    _gpu_cache[gpu_index] = (now, snapshot)
+    return dict(snapshot)
+
+
+def _read_gpu_snapshot(gpu_index: int) -> dict:
+    """Read a GPU snapshot through NVML if available, else nvidia-smi."""
+    snapshot = _nvml_snapshot(gpu_index)
+    if snapshot is not None:
+        return snapshot
     try:
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=index,memory.used,memory.total,utilization.gpu",
@@ -190,32 +317,143 @@ def get_gpu_snapshot(gpu_index: int = 0) -> dict:
 
 # ── JSON Span Exporter ─────────────────────────────────────────────────
 
+def _parse_jsonl(lines: list) -> list[dict]:
+    """Parse JSON Lines (str, or bytes with orjson), skipping blank and bad lines."""
+    loads = orjson.loads if orjson is not None else json.loads
+    records = []
+    for line in lines:
+        if line.strip():
+            try:
+                records.append(loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def _read_jsonl(filepath: Path) -> list[dict]:
+    """Read every record of a JSON Lines file; missing files read as empty."""
+    if not filepath.exists():
+        return []
+    # One read for the whole file; orjson takes the raw bytes
+    data = filepath.read_bytes()
+    if orjson is None:
+        data = data.decode("utf-8")
+    return _parse_jsonl(data.splitlines())
+
+
+def rebuild_metrics_from_jsonl(
+    path: Path, metrics: Optional[dict[str, ModelMetrics]] = None
+) -> dict[str, ModelMetrics]:
+    """
+    Aggregate per-model metrics by replaying a trace file.
+
+    Records are applied in file order, as trace_inference recorded them.
+    Pass metrics to accumulate several files into one mapping.
+    """
+    if metrics is None:
+        metrics = {}
+    for rec in _read_jsonl(path):
+        model = rec.get("model", "unknown")
+        mm = metrics.get(model)
+        if mm is None:
+            mm = metrics[model] = ModelMetrics(model=model)
+        latency_ms = rec.get("latency_ms", 0.0)
+        mm.total_calls += 1
+        mm.total_tokens += rec.get("total_tokens", 0)
+        mm.total_latency_ms += latency_ms
+        mm.latencies_ms.append(latency_ms)
+        mm.tokens_per_sec_values.append(rec.get("tokens_per_sec", 0.0))
+        if rec.get("status") == "error":
+            mm.error_count += 1
+    for mm in metrics.values():
+        mm._dirty = True
+    return metrics
+
+
 class JSONFileExporter:
-    """Exports trace spans to a JSON Lines file."""
+    """
+    Exports trace spans to a JSON Lines file.
+
+    Records are queued and appended by a background thread, up to
+    BATCH_SIZE lines per open/write, so file I/O stays off the inference
+    path. flush() waits for queued records to reach the file.
+    """
+
+    BATCH_SIZE = 64
+    TAIL_CHUNK = 8192
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="slate-trace-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush, sync=True)
+
     def export_trace(self, trace_record: InferenceTrace):
-        """Append a trace record to the JSON Lines file."""
-        with open(self.filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(trace_record.to_dict(), default=str) + "\n")
+        """Queue a trace record for appending to the JSON Lines file."""
+        self._queue.put_nowait(json.dumps(trace_record.to_dict(), default=str))
+
+    def _write_loop(self):
+        """Append queued lines in batches until the process exits."""
+        while True:
+            lines = [self._queue.get()]
+            while len(lines) < self.BATCH_SIZE:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with open(self.filepath, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError:
+                pass
+            finally:
+                for _ in lines:
+                    self._queue.task_done()
+
+    def flush(self, sync: bool = False):
+        """Block until queued records are written; fsync them if sync."""
+        self._queue.join()
+        if sync and self.filepath.exists():
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                os.fsync(f.fileno())
 
     def read_all(self) -> list[dict]:
         """Read all trace records."""
-        if not self.filepath.exists():
+        self.flush()
+        return _read_jsonl(self.filepath)
+
+    def read_tail(self, n: int) -> list[dict]:
+        """Read the last n trace records, scanning back from the end of the file."""
+        self.flush()
+        if n <= 0 or not self.filepath.exists():
             return []
-        records = []
-        with open(self.filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        records.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        return records
+        with open(self.filepath, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            want = n
+            while True:
+                # Read back until there are want lines after the first,
+                # which may start mid-record
+                while pos > 0 and data.count(b"\n") <= want:
+                    step = min(self.TAIL_CHUNK, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
+                lines = data.splitlines()
+                if pos > 0:
+                    lines = lines[1:]
+                if orjson is None:
+                    lines = [line.decode("utf-8") for line in lines]
+                records = _parse_jsonl(lines)
+                if len(records) >= n or pos == 0:
+                    return records[-n:]
+                # Blank or malformed lines were skipped; read further back
+                want += n - len(records)
 
 
 # ── Tracer ──────────────────────────────────────────────────────────────
@@ -230,6 +468,11 @@ class SlateAITracer:
 
     # Modified: 2026-02-07T14:10:00Z | Author: COPILOT | Change: AI tracing system core
 
+    # trace_inference saves metrics at most every SAVE_INTERVAL_S seconds,
+    # plus every SAVE_EVERY traces; flush_metrics() saves the remainder
+    SAVE_INTERVAL_S = 2.0
+    SAVE_EVERY = 50
+
     def __init__(self, enable_otel: bool = True, enable_console: bool = False):
         TRACE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -261,6 +504,11 @@ class SlateAITracer:
         # Counter
         self._trace_count = 0
 
+        # Metrics save debounce
+        self._last_save_ts = float("-inf")
+        self._dirty_since_save = False
+        atexit.register(self.flush_metrics)
+
     def _load_metrics(self):
         """Load persisted metrics."""
         if METRICS_FILE.exists():
@@ -286,6 +534,13 @@ class SlateAITracer:
             "models": {name: mm.to_dict() for name, mm in self.model_metrics.items()},
         }
         METRICS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self._last_save_ts = time.monotonic()
+        self._dirty_since_save = False
+
+    def flush_metrics(self):
+        """Save metrics if any trace was recorded since the last save."""
+        if self._dirty_since_save:
+            self._save_metrics()
 
     def trace_inference(
         self,
@@ -364,16 +619,15 @@ class SlateAITracer:
         mm.total_tokens += total_tokens
         mm.total_latency_ms += trace_record.latency_ms
         mm.latencies_ms.append(trace_record.latency_ms)
+        mm._dirty = True
         mm.tokens_per_sec_values.append(tok_per_sec)
         if error:
             mm.error_count += 1
-        # Keep arrays bounded
-        if len(mm.latencies_ms) > 1000:
-            mm.latencies_ms = mm.latencies_ms[-500:]
-        if len(mm.tokens_per_sec_values) > 1000:
-            mm.tokens_per_sec_values = mm.tokens_per_sec_values[-500:]
 
-        self._save_metrics()
+        self._dirty_since_save = True
+        if (time.monotonic() - self._last_save_ts > self.SAVE_INTERVAL_S
+                or self._trace_count % self.SAVE_EVERY == 0):
+            self._save_metrics()
 
         # OpenTelemetry span
         if self.otel_tracer:
@@ -421,8 +675,7 @@ class SlateAITracer:
 
     def get_recent_traces(self, limit: int = 20) -> list[dict]:
         """Get recent trace records."""
-        all_traces = self.json_exporter.read_all()
-        return all_traces[-limit:]
+        return self.json_exporter.read_tail(limit)
 
     def generate_report(self) -> str:
         """Generate a human-readable trace report."""
@@ -472,6 +725,7 @@ class SlateAITracer:
 
     def reset(self):
         """Clear all trace data."""
+        self.json_exporter.flush()
         if METRICS_FILE.exists():
             METRICS_FILE.unlink()
         # Clear JSONL trace files
@@ -479,6 +733,7 @@ class SlateAITracer:
             f.unlink()
         self.model_metrics.clear()
         self._trace_count = 0
+        self._dirty_since_save = False
         print("  Trace data cleared.")
 
 
@@ -503,6 +758,7 @@ def main():
     parser.add_argument("--report", action="store_true", help="Generate trace report")
     parser.add_argument("--export", choices=["json"], help="Export traces to file")
     parser.add_argument("--reset", action="store_true", help="Clear trace history")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild metrics from trace files")
     parser.add_argument("--recent", type=int, default=10, help="Show N recent traces")
     args = parser.parse_args()
 
@@ -512,6 +768,16 @@ def main():
         tracer.reset()
         return
 
+    if args.rebuild:
+        metrics: dict[str, ModelMetrics] = {}
+        for path in sorted(TRACE_DIR.glob("traces_*.jsonl")):
+            rebuild_metrics_from_jsonl(path, metrics)
+        tracer.model_metrics = metrics
+        tracer._trace_count = sum(mm.total_calls for mm in metrics.values())
+        tracer._save_metrics()
+        print(f"  Rebuilt metrics for {len(metrics)} models from {tracer._trace_count} traces")
+        return
+
     if args.export == "json":
         traces = tracer.json_exporter.read_all()
         export_path = TRACE_DIR / f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -3260,8 +3260,11 @@ def build_template_js() -> str:
                 try {
                     const data = JSON.parse(e.data);
                     if (data.type === 'status') updateStatus(data);
-                    if (data.type === 'task_update') refreshTasks();
-                    if (data.type === 'workflow_update') refreshWorkflows();
+                    if (data.type === 'task_update' || data.type === 'workflow_update') {
+                        if (statusStreamOpen()) statusWs.send(JSON.stringify({ type: 'refresh' }));
+                        else if (data.type === 'task_update') refreshTasks();
+                        else refreshWorkflows();
+                    }
                 } catch(err) {}
             };
         }
@@ -3414,52 +3417,83 @@ def build_template_js() -> str:
         }
 
         // ─── Refresh Functions ────────────────────────────────────────
+        function renderTasks(data) {
+            const list = document.getElementById('task-list');
+            if (!data.tasks || data.tasks.length === 0) {
+                list.innerHTML = '<div class="empty">No tasks</div>';
+                return;
+            }
+            const navBadge = document.getElementById('nav-task-count');
+            if (navBadge) navBadge.textContent = data.tasks.length;
+            list.innerHTML = data.tasks.map(t => {
+                const statusCls = t.status === 'completed' ? 'online' : t.status === 'in_progress' ? 'warning' : 'pending';
+                return '<div class="task-item"><span>' + (t.title || t.id) + '</span><span class="badge ' + statusCls + '">' + t.status + '</span></div>';
+            }).join('');
+        }
+
+        function renderWorkflows(data) {
+            const list = document.getElementById('workflow-list');
+            if (!data.runs || data.runs.length === 0) {
+                list.innerHTML = '<div class="empty">No workflows</div>';
+                return;
+            }
+            const navWfBadge = document.getElementById('nav-wf-count');
+            if (navWfBadge) navWfBadge.textContent = data.runs.length;
+            list.innerHTML = data.runs.slice(0, 10).map(w => {
+                const icon = w.conclusion === 'success' ? '<span class="ok">&#10003;</span>' :
+                             w.conclusion === 'failure' ? '<span class="err">&#10007;</span>' :
+                             w.status === 'in_progress' ? '<span style="color:var(--sl-warning)">&#9679;</span>' : '&#9679;';
+                return '<div class="wf-item"><span class="wf-name">' + icon + ' ' + (w.name || '') + '</span><span class="wf-meta">#' + (w.run_number || '') + '</span></div>';
+            }).join('');
+        }
+
+        function renderRunner(data) {
+            updateStatus({ runner_online: data.status === 'online' || data.runner?.status === 'online' });
+        }
+
         async function refreshTasks() {
             try {
                 const res = await fetch('/api/tasks');
-                const data = await res.json();
-                const list = document.getElementById('task-list');
-                if (!data.tasks || data.tasks.length === 0) {
-                    list.innerHTML = '<div class="empty">No tasks</div>';
-                    return;
-                }
-                const navBadge = document.getElementById('nav-task-count');
-                if (navBadge) navBadge.textContent = data.tasks.length;
-                list.innerHTML = data.tasks.map(t => {
-                    const statusCls = t.status === 'completed' ? 'online' : t.status === 'in_progress' ? 'warning' : 'pending';
-                    return '<div class="task-item"><span>' + (t.title || t.id) + '</span><span class="badge ' + statusCls + '">' + t.status + '</span></div>';
-                }).join('');
+                renderTasks(await res.json());
             } catch (e) { console.log('Tasks refresh error:', e); }
         }
 
         async function refreshWorkflows() {
             try {
                 const res = await fetch('/api/workflows');
-                const data = await res.json();
-                const list = document.getElementById('workflow-list');
-                if (!data.runs || data.runs.length === 0) {
-                    list.innerHTML = '<div class="empty">No workflows</div>';
-                    return;
-                }
-                const navWfBadge = document.getElementById('nav-wf-count');
-                if (navWfBadge) navWfBadge.textContent = data.runs.length;
-                list.innerHTML = data.runs.slice(0, 10).map(w => {
-                    const icon = w.conclusion === 'success' ? '<span class="ok">&#10003;</span>' :
-                                 w.conclusion === 'failure' ? '<span class="err">&#10007;</span>' :
-                                 w.status === 'in_progress' ? '<span style="color:var(--sl-warning)">&#9679;</span>' : '&#9679;';
-                    return '<div class="wf-item"><span class="wf-name">' + icon + ' ' + (w.name || '') + '</span><span class="wf-meta">#' + (w.run_number || '') + '</span></div>';
-                }).join('');
+                renderWorkflows(await res.json());
             } catch (e) { console.log('Workflows refresh error:', e); }
         }
 
         async function refreshRunner() {
             try {
                 const res = await fetch('/api/runner');
-                const data = await res.json();
-                updateStatus({ runner_online: data.status === 'online' || data.runner?.status === 'online' });
+                renderRunner(await res.json());
             } catch (e) {}
         }
 
+        // ─── Status Stream ────────────────────────────────────────────
+        // One push socket replaces polling of tasks/workflows/runner; the
+        // REST refreshers above remain as fallback while it is down.
+        let statusWs = null;
+        function statusStreamOpen() {
+            return statusWs && statusWs.readyState === WebSocket.OPEN;
+        }
+        function connectStatusStream() {
+            const proto = location.protocol === 'https:' ? 'wss:' : 'ws:';
+            statusWs = new WebSocket(proto + '//' + location.host + '/ws/status');
+            statusWs.onmessage = (e) => {
+                try {
+                    const msg = JSON.parse(e.data);
+                    if (msg.tasks) renderTasks(msg.tasks);
+                    if (msg.workflows) renderWorkflows(msg.workflows);
+                    if (msg.runner) renderRunner(msg.runner);
+                } catch(err) {}
+            };
+            statusWs.onclose = () => { setTimeout(connectStatusStream, 5000); };
+        }
+        connectStatusStream();
+
         async function refreshWorkflowPipeline() {
             try {
                 const res = await fetch('/api/status');
@@ -3737,9 +3771,11 @@ def build_template_js() -> str:
 
         // ─── Refresh All ──────────────────────────────────────────────
         function refreshAll() {
-            refreshTasks();
-            refreshWorkflows();
-            refreshRunner();
+            if (!statusStreamOpen()) {
+                refreshTasks();
+                refreshWorkflows();
+                refreshRunner();
+            }
             refreshWorkflowPipeline();
             refreshGitHub();
             refreshSystemHealth();
@@ -6,8 +6,11 @@ Tests for SLATE Schematic Diagram Generation SDK.
 Covers: components, theme, layout, SVG renderer, engine, library, exporters.
 """
 
+import dataclasses
 import json
+import math
 import os
+import random
 import sys
 import tempfile
 from pathlib import Path
@@ -138,6 +141,26 @@ class TestPort:
         assert p.type == "input"
 
 
+class TestPortFactory:
+    """Test shared, immutable ports."""
+
+    def test_port_is_frozen_and_hashable(self):
+        p = Port(id="in", position=PortPosition.LEFT, type="input")
+        with pytest.raises(AttributeError):
+            p.id = "out"
+        assert p in {Port(id="in", position=PortPosition.LEFT, type="input")}
+
+    def test_port_factory_shares_instances(self):
+        from slate.schematic_sdk.components import port
+        assert port("in", PortPosition.LEFT, "input") is port("in", PortPosition.LEFT, "input")
+
+    def test_default_ports_shared_across_components(self):
+        a = ServiceNode(id="a", label="A")
+        b = DatabaseNode(id="b", label="B")
+        assert a.ports is not b.ports
+        assert a.ports[0] is b.ports[0]
+
+
 class TestComponent:
     """Test base Component and all node types."""
 
@@ -306,6 +329,38 @@ class TestThemeManager:
         border = tm.get_component_border("gpu", "active")
         assert isinstance(border, str)
 
+    def test_border_follows_status(self):
+        tm = ThemeManager("blueprint")
+        c = tm.theme.colors
+        assert tm.get_component_border("gpu", "active") == c.primary
+        assert tm.get_component_border("gpu", "error") == c.status_error
+        assert tm.get_component_border("gpu", "bogus") == c.status_inactive
+        assert tm.get_component_fill("bogus") == c.surface_container
+
+    def test_overrides_applied(self):
+        colors = ThemeManager("light").theme.colors
+        assert colors.text_primary == "#1C1B1A"
+        assert colors.status_active == SchematicColors().status_active
+
+    def test_theme_frozen_and_hashable(self):
+        theme = ThemeManager("dark").theme
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            theme.colors.primary = "#000000"
+        assert hash(theme) == hash(ThemeManager("dark").theme)
+
+    def test_theme_slotted(self):
+        theme = ThemeManager("dark").theme
+        for obj in (theme, theme.colors, theme.typography, theme.effects):
+            assert not hasattr(obj, "__dict__")
+        recolored = dataclasses.replace(theme.colors, primary="#000000")
+        assert recolored.primary == "#000000"
+        assert recolored.background == theme.colors.background
+
+    def test_theme_factories_shared(self):
+        assert BlueprintTheme() is BlueprintTheme()
+        assert DarkTheme().name == "dark"
+        assert LightTheme() == ThemeManager("light").theme
+
 
 class TestSchematicColors:
     """Test SchematicColors dataclass."""
@@ -373,6 +428,14 @@ class TestHierarchicalLayout:
         assert result.positions["a"][1] == result.positions["b"][1]
         assert result.positions["a"][0] != result.positions["b"][0]
 
+    def test_bounds_cover_positions(self):
+        layout = HierarchicalLayout()
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}", layer=i % 3) for i in range(7)]
+        result = layout.calculate_positions(comps, [], SchematicConfig())
+        xs = [p[0] for p in result.positions.values()]
+        ys = [p[1] for p in result.positions.values()]
+        assert result.bounds == (min(xs), min(ys), max(xs), max(ys))
+
 
 class TestForceDirectedLayout:
     """Test ForceDirectedLayout algorithm."""
@@ -408,6 +471,143 @@ class TestForceDirectedLayout:
         assert positions[0] != positions[1]
         assert positions[1] != positions[2]
 
+    def test_leaves_global_random_state_alone(self):
+        comps = [ServiceNode(id="a", label="A"), ServiceNode(id="b", label="B")]
+        state = random.getstate()
+        ForceDirectedLayout(iterations=1).calculate_positions(comps, [], SchematicConfig())
+        assert random.getstate() == state
+
+    @pytest.mark.parametrize("n", [3, 40])
+    def test_stops_once_settled(self, n):
+        """A settled layout is reached before the iteration cap."""
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(n)]
+        conns = [
+            FlowConnector(id=f"c{i}", from_node=f"n{i}", to_node=f"n{(i + 1) % n}")
+            for i in range(n)
+        ]
+        config = SchematicConfig()
+        capped = ForceDirectedLayout(iterations=300, damping=0.3)
+        longer = ForceDirectedLayout(iterations=3000, damping=0.3)
+        assert capped.calculate_positions(comps, conns, config) == longer.calculate_positions(
+            comps, conns, config
+        )
+
+    def test_ignores_dangling_connections(self):
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(6)]
+        conns = [
+            FlowConnector(id="c1", from_node="n0", to_node="n1"),
+            FlowConnector(id="c2", from_node="n1", to_node="n4"),
+        ]
+        dangling = conns + [FlowConnector(id="c3", from_node="n2", to_node="missing")]
+        config = SchematicConfig()
+        layout = ForceDirectedLayout(iterations=30)
+        expected = layout.calculate_positions(comps, conns, config)
+        assert layout.calculate_positions(comps, dangling, config) == expected
+
+    def test_all_pinned_keeps_positions(self):
+        comps = [
+            ServiceNode(id="a", label="A", position=(10, 20)),
+            ServiceNode(id="b", label="B", position=(500, 30)),
+        ]
+        result = ForceDirectedLayout().calculate_positions(comps, [], SchematicConfig())
+        assert result.positions == {"a": (10, 20), "b": (500, 30)}
+        assert result.bounds == (10, 20, 500, 30)
+
+    @pytest.mark.parametrize("mode", ["python", "numpy", "compiled"])
+    def test_pinned_nodes_stay_put(self, monkeypatch, mode):
+        import slate.schematic_sdk.layout as layout_mod
+        n = 8 if mode == "python" else 40
+        if mode != "python" and layout_mod.np is None:
+            pytest.skip("numpy not installed")
+        if mode == "compiled" and layout_mod._load_compiled() is None:
+            pytest.skip("numba not installed")
+        if mode == "numpy":
+            monkeypatch.setattr(layout_mod, "_load_compiled", lambda: None)
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(n)]
+        # Outside the padded bounds, so clipping would move it
+        comps[0].position = (5.0, 5.0)
+        conns = [FlowConnector(id="c", from_node="n0", to_node="n1")]
+        result = ForceDirectedLayout(iterations=20).calculate_positions(
+            comps, conns, SchematicConfig()
+        )
+        assert result.positions["n0"] == (5.0, 5.0)
+        assert result.positions["n1"] != result.positions["n2"]
+
+    @pytest.mark.parametrize("mode", ["numpy", "compiled", "parallel"])
+    def test_numpy_matches_pure_python(self, monkeypatch, mode):
+        """The NumPy and numba simulations should track the pure-Python loop."""
+        import slate.schematic_sdk.layout as layout_mod
+        if layout_mod.np is None:
+            pytest.skip("numpy not installed")
+        kernels = layout_mod._load_compiled()
+        if mode != "numpy" and kernels is None:
+            pytest.skip("numba not installed")
+        if mode == "numpy":
+            monkeypatch.setattr(layout_mod, "_load_compiled", lambda: None)
+        elif mode == "parallel":
+            monkeypatch.setattr(ForceDirectedLayout, "_PARALLEL_MIN_NODES", 0)
+            monkeypatch.setattr(kernels, "parallel_available", lambda: True)
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(40)]
+        conns = [
+            FlowConnector(id=f"c{i}", from_node=f"n{i}", to_node=f"n{(i + 3) % 40}")
+            for i in range(40)
+        ]
+        config = SchematicConfig()
+        fast = ForceDirectedLayout(iterations=5).calculate_positions(comps, conns, config)
+        monkeypatch.setattr(layout_mod, "np", None)
+        slow = ForceDirectedLayout(iterations=5).calculate_positions(comps, conns, config)
+        for comp_id, (x, y) in slow.positions.items():
+            assert fast.positions[comp_id] == pytest.approx((x, y))
+
+
+class TestBarnesHutTree:
+    """Test the quadtree used for approximate repulsion."""
+
+    @staticmethod
+    def _exact(xs, ys, i, strength):
+        fx = fy = 0.0
+        for j in range(len(xs)):
+            if j == i:
+                continue
+            dx, dy = xs[j] - xs[i], ys[j] - ys[i]
+            d2 = dx * dx + dy * dy + 1e-4
+            f = strength / (d2 * math.sqrt(d2))
+            fx -= f * dx
+            fy -= f * dy
+        return fx, fy
+
+    def _cloud(self):
+        rng = random.Random(7)
+        xs = [rng.uniform(0, 800) for _ in range(200)]
+        ys = [rng.uniform(0, 600) for _ in range(200)]
+        # Coincident nodes must not recurse forever
+        xs[1], ys[1] = xs[0], ys[0]
+        return xs, ys
+
+    def test_theta_zero_is_exact(self):
+        from slate.schematic_sdk.layout import _BarnesHutTree
+        xs, ys = self._cloud()
+        tree = _BarnesHutTree(xs, ys)
+        for i in (0, 1, 50, 199):
+            assert tree.repulsion(i, 500, 0.0) == pytest.approx(self._exact(xs, ys, i, 500))
+
+    def test_approximation_close(self):
+        from slate.schematic_sdk.layout import _BarnesHutTree
+        xs, ys = self._cloud()
+        tree = _BarnesHutTree(xs, ys)
+        for i in (10, 100, 150):
+            ex, ey = self._exact(xs, ys, i, 500)
+            ax, ay = tree.repulsion(i, 500, 0.5)
+            assert math.hypot(ax - ex, ay - ey) <= 0.25 * math.hypot(ex, ey)
+
+    def test_layout_uses_tree_without_numpy(self, monkeypatch):
+        import slate.schematic_sdk.layout as layout_mod
+        monkeypatch.setattr(layout_mod, "np", None)
+        layout = ForceDirectedLayout(iterations=5, barnes_hut_min_nodes=10)
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(20)]
+        result = layout.calculate_positions(comps, [], SchematicConfig())
+        assert len(set(result.positions.values())) == 20
+
 
 class TestGridLayout:
     """Test GridLayout algorithm."""
@@ -435,6 +635,16 @@ class TestGridLayout:
         # Second row should be different Y
         assert result.positions["n3"][1] > result.positions["n0"][1]
 
+    def test_large_grid_matches_loop(self, monkeypatch):
+        import slate.schematic_sdk.layout as layout_mod
+        comps = [ServiceNode(id=f"n{i}", label=f"N{i}") for i in range(100)]
+        config = SchematicConfig()
+        fast = GridLayout(columns=7).calculate_positions(comps, [], config)
+        monkeypatch.setattr(layout_mod, "np", None)
+        slow = GridLayout(columns=7).calculate_positions(comps, [], config)
+        assert fast.positions == slow.positions
+        assert fast.bounds == slow.bounds
+
 
 class TestGetLayoutEngine:
     """Test layout engine factory."""
@@ -451,6 +661,10 @@ class TestGetLayoutEngine:
         engine = get_layout_engine("grid")
         assert isinstance(engine, GridLayout)
 
+    def test_base_requires_override(self):
+        with pytest.raises(NotImplementedError):
+            LayoutEngine().calculate_positions([], [], SchematicConfig())
+
 
 # ── SVG Renderer Tests ───────────────────────────────────────────────────────
 
@@ -513,6 +727,72 @@ class TestSVGRenderer:
         assert 'data-from="a"' in svg
         assert 'data-to="b"' in svg
 
+    def test_connection_anchored_at_component_edges(self):
+        r = self._make_renderer()
+        comps = [ServiceNode(id="a", label="A"), DatabaseNode(id="b", label="B")]
+        conns = [FlowConnector(id="c1", from_node="a", to_node="b")]
+        positions = {"a": (200, 300), "b": (600, 100), "loose": (50, 50)}
+        svg = r.render(comps, conns + [
+            FlowConnector(id="c2", from_node="loose", to_node="a"),
+        ], positions, SchematicConfig())
+        # Service is 140 wide and database 100: right edge to left edge
+        assert 'd="M 270.0 300 C 410.0 300, 410.0 100, 550.0 100"' in svg
+        # Positioned ids without a component are anchored at their center
+        assert 'd="M 50 50 C 90.0 50, 90.0 300, 130.0 300"' in svg
+
+    def test_connection_dash_styles(self):
+        r = self._make_renderer()
+        comps = [ServiceNode(id="a", label="A"), ServiceNode(id="b", label="B")]
+        positions = {"a": (200, 300), "b": (600, 300)}
+        for style, dash in [
+            (ConnectionStyle.SOLID, None),
+            (ConnectionStyle.DASHED, 'stroke-dasharray="5,5"'),
+            (ConnectionStyle.DOTTED, 'stroke-dasharray="2,2"'),
+        ]:
+            conns = [FlowConnector(id="c", from_node="a", to_node="b", style=style)]
+            svg = r.render(comps, conns, positions, SchematicConfig())
+            path = svg.split('<g class="connection"', 1)[1].split("</g>", 1)[0]
+            if dash:
+                assert dash in path
+            else:
+                assert "stroke-dasharray" not in path
+
+    def test_component_body_reused_across_positions(self):
+        r = self._make_renderer()
+        comps = [GPUNode(id="g", label="G")]
+        first = r.render(comps, [], {"g": (100, 200)}, SchematicConfig())
+        moved = r.render(comps, [], {"g": (300, 50)}, SchematicConfig())
+        assert 'transform="translate(100, 200)"' in first
+        assert 'transform="translate(300, 50)"' in moved
+
+        def body(svg):
+            return svg.split('data-id="g"', 1)[1].split(">", 1)[1].split("</g>", 1)[0]
+
+        assert body(first) == body(moved)
+        assert len(r._component_bodies) == 1
+
+    def test_render_bytes_matches_render(self):
+        r = self._make_renderer()
+        comps = [ServiceNode(id="a", label="Café → ünïcode", sublabel="<&>")]
+        args = (comps, [], {"a": (100, 100)}, SchematicConfig(version_badge="v1"))
+        assert r.render_bytes(*args) == r.render(*args).encode("utf-8")
+
+    def test_annotation_styles(self):
+        r = self._make_renderer()
+        t = r.theme.typography
+        anns = [
+            Annotation(id="t", text="T", position=(1, 2), style="title"),
+            Annotation(id="n", text="N", position=(3, 4), style="note"),
+            Annotation(id="l", text="L", position=(5, 6)),
+        ]
+        svg = r.render([], [], {}, SchematicConfig(), annotations=anns)
+        layer = svg.split('<g class="annotations-layer">', 1)[1].split("</g>", 1)[0]
+        texts = layer.split("<text")[1:]
+        assert len(texts) == 3
+        assert f'font-size="{t.title_size}"' in texts[0] and ">T</text>" in texts[0]
+        assert f'fill="{r.theme.colors.text_muted}"' in texts[1]
+        assert 'x="5" y="6"' in texts[2]
+
     def test_render_grid(self):
         r = self._make_renderer()
         svg = r.render([], [], {}, SchematicConfig(show_grid=True))
@@ -539,6 +819,21 @@ class TestSVGRenderer:
         svg = r.render([], [], {}, SchematicConfig(title="My Title", show_title=True))
         assert "My Title" in svg
 
+    def test_component_text_uses_theme(self):
+        r = SVGRenderer(ThemeManager("light"))
+        comps = [ServiceNode(id="svc", label="Service")]
+        svg = r.render(comps, [], {"svc": (200, 200)}, SchematicConfig())
+        assert 'fill="#1C1B1A">Service</text>' in svg
+
+    def test_labels_escaped(self):
+        r = self._make_renderer()
+        comps = [ServiceNode(id="svc", label="A & <B>", sublabel='"q"')]
+        svg = r.render(comps, [], {"svc": (200, 200)}, SchematicConfig())
+        assert ">A &amp; &lt;B&gt;</text>" in svg
+        assert ">&quot;q&quot;</text>" in svg
+        # Rendering again reuses the escaped label
+        assert r.render(comps, [], {"svc": (200, 200)}, SchematicConfig()) == svg
+
     def test_defs_present(self):
         r = self._make_renderer()
         svg = r.render([], [], {}, SchematicConfig())
@@ -608,6 +903,16 @@ class TestSchematicEngine:
         svg = e.render_svg()
         assert len(e.positions) == 2
 
+    def test_reset(self):
+        e = SchematicEngine(SchematicConfig(title="Keep"))
+        e.add_node(ServiceNode(id="a", label="A"))
+        e.add_connector(FlowConnector(id="c", from_node="a", to_node="a"))
+        e.add_annotation(Annotation(id="n", text="Note", position=(1, 1)))
+        e.render_svg()
+        assert e.reset() is e
+        assert not (e.components or e.connections or e.annotations or e.positions)
+        assert e.config.title == "Keep"
+
     def test_set_theme(self):
         e = SchematicEngine()
         result = e.set_theme("dark")
@@ -756,6 +1061,20 @@ class TestLibraryTemplates:
         assert "runner" in ids
         assert "lint" in ids
 
+    def test_templates_return_fresh_lists(self):
+        components, connections = get_slate_system_template()
+        assert isinstance(components, list) and isinstance(connections, list)
+        components[0].label = "Edited"
+        components.clear()
+        again, _ = get_slate_system_template()
+        assert again and again[0].label != "Edited"
+
+    def test_build_from_template_unaffected_by_edited_template(self):
+        before = build_from_template("system")
+        components, _ = get_slate_system_template()
+        components[0].label = "Edited"
+        assert build_from_template("system") == before
+
     def test_list_templates(self):
         templates = list_templates()
         assert len(templates) >= 3
@@ -778,6 +1097,14 @@ class TestLibraryTemplates:
         svg = build_from_template("cicd")
         assert "<?xml" in svg
 
+    def test_build_from_template_reuses_engine(self):
+        from slate.schematic_sdk import library
+        first = build_from_template("cicd")
+        engine = library._POOL.engines["cicd"]
+        assert build_from_template("cicd") == first
+        assert library._POOL.engines["cicd"] is engine
+        assert len(engine.components) == len(get_cicd_pipeline_template()[0])
+
     def test_build_from_unknown_template(self):
         with pytest.raises(KeyError, match="Unknown template"):
             build_from_template("nonexistent")
@@ -848,6 +1175,11 @@ class TestMarkdownExporter:
         assert not inline.startswith("<?xml")
         assert "<svg>" in inline
 
+    def test_to_inline_without_declaration(self):
+        svg = "<svg><rect/></svg>"
+        assert MarkdownExporter.to_inline(svg) is svg
+        assert MarkdownExporter.to_inline("<?xml unterminated") == "<?xml unterminated"
+
     def test_to_link(self):
         link = MarkdownExporter.to_link("docs/diagram.svg", alt="Architecture")
         assert "![Architecture](docs/diagram.svg)" == link
@@ -870,6 +1202,19 @@ class TestJSONExporter:
         assert data["content"] == svg
         assert data["svg_length"] == len(svg)
 
+    def test_manifest_bytes_match_text(self):
+        svg = "<svg><text>Ünïcode</text></svg>"
+        raw = JSONExporter.to_manifest_bytes(svg)
+        assert isinstance(raw, bytes)
+        assert raw.decode("utf-8") == JSONExporter.to_manifest(svg)
+        assert json.loads(raw)["content"] == svg
+        assert "Ünïcode" in raw.decode("utf-8")
+
+    def test_manifest_non_str_keys_and_big_ints(self):
+        manifest = JSONExporter.to_manifest("<svg/>", {"pins": {1: "vcc"}, "serial": 2**70})
+        data = json.loads(manifest)
+        assert data["metadata"] == {"pins": {"1": "vcc"}, "serial": 2**70}
+
     def test_to_file(self):
         svg = "<svg><rect/></svg>"
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
@@ -968,3 +1313,89 @@ class TestEndToEnd:
             engine.set_layout(layout)
             svg = engine.render_svg()
             assert "<?xml" in svg
+
+
+# ── CLI Tests ────────────────────────────────────────────────────────────────
+
+class TestCLI:
+    """Test the schematic CLI entry point."""
+
+    def test_sniff_subcommand(self):
+        from slate.schematic_sdk.cli import _sniff_subcommand
+        assert _sniff_subcommand(["validate", "-i", "x.yaml"]) == "validate"
+        assert _sniff_subcommand(["-h"]) is None
+        assert _sniff_subcommand(["bogus"]) is None
+        assert _sniff_subcommand(["components", "generate"]) == "components"
+
+    def test_no_command_prints_help(self, capsys):
+        from slate.schematic_sdk.cli import main
+        assert main([]) == 0
+        assert "validate" in capsys.readouterr().out
+
+    def test_validate_json(self, tmp_path, capsys):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({
+            "components": [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
+            "connections": [{"from_node": "a", "to_node": "b"}],
+        }), encoding="utf-8")
+        assert main(["validate", "-i", str(path)]) == 0
+        assert "PASSED" in capsys.readouterr().out
+
+    def test_definition_parsed_once_while_unchanged(self, tmp_path):
+        from slate.schematic_sdk.cli import _load_definition, _parse_definition
+        path = tmp_path / "d.json"
+        path.write_text('{"components": []}', encoding="utf-8")
+        _parse_definition.cache_clear()
+        first = _load_definition(path)
+        assert _load_definition(path) is first
+        assert _parse_definition.cache_info().hits == 1
+
+    def test_validate_rejects_unknown_type(self, tmp_path, capsys):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({
+            "components": [{"id": "a", "label": "A", "type": "mainframe"}],
+        }), encoding="utf-8")
+        assert main(["validate", "-i", str(path)]) == 1
+        assert "unknown type 'mainframe'" in capsys.readouterr().out
+
+    def test_validate_reports_dangling_connection(self, tmp_path, capsys):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({
+            "components": [{"id": "a", "label": "A"}, {"label": "no id"}],
+            "connections": [{"from": "a", "to": "missing"}, {"to_node": "a"}],
+        }), encoding="utf-8")
+        assert main(["validate", "-i", str(path)]) == 1
+        out = capsys.readouterr().out
+        assert "Component 1: missing 'id' field" in out
+        assert "Connection 0: invalid 'to' node" in out
+        assert "Connection 1: invalid 'from' node" in out
+
+    def test_validate_accepts_either_connection_key(self, tmp_path):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({
+            "components": [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
+            "connections": [{"from_node": "stale", "from": "a", "to_node": "b", "to": "x"}],
+        }), encoding="utf-8")
+        assert main(["validate", "-i", str(path)]) == 0
+
+    def test_validate_fail_fast_reports_first_error_only(self, tmp_path, capsys):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({
+            "components": [{"label": "no id"}, {"id": "b"}],
+        }), encoding="utf-8")
+        assert main(["validate", "-i", str(path), "--fail-fast"]) == 1
+        out = capsys.readouterr().out
+        assert "Component 0: missing 'id' field" in out
+        assert "Component 1" not in out
+
+    def test_quiet_suppresses_status(self, tmp_path, capsys):
+        from slate.schematic_sdk.cli import main
+        path = tmp_path / "d.json"
+        path.write_text(json.dumps({"components": [{"id": "a", "label": "A"}]}), encoding="utf-8")
+        assert main(["--quiet", "validate", "-i", str(path)]) == 0
+        assert capsys.readouterr().out == ""
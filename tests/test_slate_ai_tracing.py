@@ -3,6 +3,7 @@
 Tests for slate/slate_ai_tracing.py — inference tracing, metrics, export.
 """
 
+import dataclasses
 import json
 import os
 import pytest
@@ -10,6 +11,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
 
+from slate import slate_ai_tracing as tracing
 from slate.slate_ai_tracing import (
     InferenceTrace,
     ModelMetrics,
@@ -76,6 +78,9 @@ class TestInferenceTrace:
         assert d["total_tokens"] == 150
         assert "trace_id" in d
         assert "error" in d
+        assert d == dataclasses.asdict(trace)
+        d["model"] = "changed"
+        assert trace.model == "slate-coder:latest"
 
     def test_trace_with_error(self):
         trace = InferenceTrace(
@@ -126,6 +131,45 @@ class TestModelMetrics:
         assert mm.p50_latency_ms > 0
         assert mm.p95_latency_ms >= mm.p50_latency_ms
 
+    def test_percentiles(self):
+        mm = ModelMetrics(model="test-model")
+        mm.latencies_ms = [float(v) for v in range(100, 0, -1)]
+        assert mm.p50_latency_ms == 50.5
+        assert mm.p95_latency_ms == 96.0
+        assert mm.p99_latency_ms == 100.0
+
+        mm.latencies_ms = [5.0]
+        mm._dirty = True
+        assert mm._percentiles() == (5.0, 5.0, 5.0)
+
+    def test_percentiles_resort_when_dirty(self):
+        mm = ModelMetrics(model="test-model")
+        mm.latencies_ms = [10.0, 20.0, 30.0]
+        assert mm.p99_latency_ms == 30.0
+        mm.latencies_ms.append(40.0)
+        mm._dirty = True
+        assert mm.p99_latency_ms == 40.0
+        assert mm.p50_latency_ms == 25.0
+
+    def test_sample_window_bounded(self):
+        mm = ModelMetrics(model="test-model")
+        for v in range(tracing.SAMPLE_WINDOW + 10):
+            mm.latencies_ms.append(float(v))
+            mm.tokens_per_sec_values.append(1.0)
+        assert len(mm.latencies_ms) == tracing.SAMPLE_WINDOW
+        assert len(mm.tokens_per_sec_values) == tracing.SAMPLE_WINDOW
+        assert list(mm.latencies_ms)[:2] == [10.0, 11.0]
+        assert list(mm.latencies_ms)[-1] == float(tracing.SAMPLE_WINDOW + 9)
+
+    def test_sample_window_float32(self):
+        window = tracing.SampleWindow(size=3)
+        assert len(window) == 0 and list(window) == []
+        for v in (1.5, 2.5, 1234.5, 0.1):
+            window.append(v)
+        assert len(window) == 3
+        assert list(window)[:2] == [2.5, 1234.5]
+        assert list(window)[2] == pytest.approx(0.1, rel=1e-6)
+
     def test_metrics_to_dict(self):
         mm = ModelMetrics(model="test-model")
         mm.total_calls = 5
@@ -201,12 +245,86 @@ class TestJSONFileExporter:
         records = exporter.read_all()
         assert len(records) == 5
 
+    def test_flush_writes_batches_in_order(self, tmp_path):
+        filepath = tmp_path / "batched.jsonl"
+        exporter = JSONFileExporter(filepath)
+
+        for i in range(JSONFileExporter.BATCH_SIZE * 2 + 3):
+            exporter.export_trace(InferenceTrace(
+                trace_id=f"batch-{i:03d}",
+                span_id=f"span-{i:03d}",
+                timestamp="2026-07-12T00:00:00Z",
+                model="test-model",
+                task_type="test",
+                prompt_tokens=0,
+                completion_tokens=0,
+                total_tokens=0,
+                latency_ms=1.0,
+                eval_time_ms=0.0,
+                tokens_per_sec=0.0,
+                gpu_index=0,
+                gpu_memory_used_mb=0,
+                gpu_memory_total_mb=0,
+                status="success",
+            ))
+        exporter.flush(sync=True)
+
+        lines = filepath.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["trace_id"] for line in lines] == [
+            f"batch-{i:03d}" for i in range(JSONFileExporter.BATCH_SIZE * 2 + 3)
+        ]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_read_skips_blank_and_bad_lines(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr("slate.slate_ai_tracing.orjson", None)
+        elif tracing.orjson is None:
+            pytest.skip("orjson not installed")
+        filepath = tmp_path / "mixed.jsonl"
+        filepath.write_text('{"a": 1}\n\n{broken\n  {"b": "é"}  \r\n', encoding="utf-8")
+        assert JSONFileExporter(filepath).read_all() == [{"a": 1}, {"b": "é"}]
+
+    @pytest.mark.parametrize("chunk", [16, 8192])
+    def test_read_tail(self, tmp_path, monkeypatch, chunk):
+        monkeypatch.setattr(JSONFileExporter, "TAIL_CHUNK", chunk)
+        filepath = tmp_path / "tail.jsonl"
+        lines = [json.dumps({"i": i}) for i in range(40)]
+        lines[-2:-2] = ["", "{broken"]
+        filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        exporter = JSONFileExporter(filepath)
+
+        assert exporter.read_tail(5) == exporter.read_all()[-5:]
+        assert exporter.read_tail(100) == exporter.read_all()
+        assert exporter.read_tail(0) == []
+
     def test_read_empty_file(self, tmp_path):
         filepath = tmp_path / "empty.jsonl"
         exporter = JSONFileExporter(filepath)
         records = exporter.read_all()
         assert records == []
 
+    def test_rebuild_metrics_from_jsonl(self, tmp_path):
+        day1 = tmp_path / "traces_1.jsonl"
+        day2 = tmp_path / "traces_2.jsonl"
+        day1.write_text("\n".join(json.dumps(r) for r in [
+            {"model": "a", "total_tokens": 10, "latency_ms": 100.0, "tokens_per_sec": 20.0, "status": "success"},
+            {"model": "a", "total_tokens": 5, "latency_ms": 300.0, "tokens_per_sec": 40.0, "status": "error"},
+            {"model": "b", "total_tokens": 1, "latency_ms": 50.0, "tokens_per_sec": 10.0, "status": "success"},
+        ]) + "\n", encoding="utf-8")
+        day2.write_text(json.dumps(
+            {"model": "a", "total_tokens": 0, "latency_ms": 200.0, "tokens_per_sec": 30.0, "status": "success"}
+        ) + "\n", encoding="utf-8")
+
+        metrics = tracing.rebuild_metrics_from_jsonl(day1)
+        tracing.rebuild_metrics_from_jsonl(day2, metrics)
+
+        a = metrics["a"]
+        assert (a.total_calls, a.total_tokens, a.error_count) == (3, 15, 1)
+        assert a.avg_latency_ms == 200.0
+        assert a.p50_latency_ms == 200.0
+        assert a.avg_tokens_per_sec == 30.0
+        assert metrics["b"].total_calls == 1
+
 
 # ── GPU Snapshot ────────────────────────────────────────────────────────
 
@@ -214,6 +332,22 @@ class TestJSONFileExporter:
 class TestGPUSnapshot:
     """Tests for GPU snapshot utility."""
 
+    @pytest.fixture(autouse=True)
+    def _empty_snapshot_cache(self, monkeypatch):
+        monkeypatch.setattr("slate.slate_ai_tracing._gpu_cache", {})
+
+    @patch("subprocess.run")
+    def test_gpu_snapshot_cached_within_ttl(self, mock_run, monkeypatch):
+        mock_run.return_value = MagicMock(returncode=0, stdout="0, 4000, 16384, 30\n")
+        monkeypatch.setattr("slate.slate_ai_tracing.pynvml", None)
+        first = get_gpu_snapshot(0)
+        assert get_gpu_snapshot(0) == first
+        assert mock_run.call_count == 1
+
+        monkeypatch.setattr("slate.slate_ai_tracing.GPU_SNAPSHOT_TTL_S", 0.0)
+        get_gpu_snapshot(0)
+        assert mock_run.call_count == 2
+
     @patch("subprocess.run")
     def test_gpu_snapshot_success(self, mock_run):
         mock_run.return_value = MagicMock(
@@ -232,6 +366,27 @@ class TestGPUSnapshot:
         assert result["gpu_index"] == 0
         assert result["memory_used_mb"] == 0
 
+    @patch("subprocess.run")
+    def test_gpu_snapshot_nvml(self, mock_run, monkeypatch):
+        nvml = MagicMock()
+        nvml.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+            used=4000 * 1024 * 1024, total=16384 * 1024 * 1024,
+        )
+        nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=30)
+        monkeypatch.setattr("slate.slate_ai_tracing.pynvml", nvml)
+        monkeypatch.setattr("slate.slate_ai_tracing._nvml_ready", None)
+        monkeypatch.setattr("slate.slate_ai_tracing._nvml_handles", {})
+
+        result = get_gpu_snapshot(1)
+        get_gpu_snapshot(1)
+        assert result == {
+            "gpu_index": 1, "memory_used_mb": 4000,
+            "memory_total_mb": 16384, "utilization_pct": 30,
+        }
+        nvml.nvmlInit.assert_called_once()
+        nvml.nvmlDeviceGetHandleByIndex.assert_called_once_with(1)
+        mock_run.assert_not_called()
+
 
 # ── SlateAITracer ───────────────────────────────────────────────────────
 
@@ -277,6 +432,28 @@ class TestSlateAITracer:
         assert trace.tokens_per_sec == 10.0  # 5 tokens / 0.5s
         assert "slate-fast:latest" in tracer.model_metrics
 
+    def test_metrics_save_debounced(self, tmp_path, monkeypatch):
+        metrics_file = tmp_path / "traces" / "metrics.json"
+        monkeypatch.setattr("slate.slate_ai_tracing.TRACE_DIR", tmp_path / "traces")
+        monkeypatch.setattr("slate.slate_ai_tracing.METRICS_FILE", metrics_file)
+
+        tracer = SlateAITracer(enable_otel=False)
+        tracer.json_exporter = JSONFileExporter(tmp_path / "traces" / "test.jsonl")
+
+        with patch("slate.slate_ai_tracing.get_gpu_snapshot", return_value={
+            "gpu_index": 0, "memory_used_mb": 0, "memory_total_mb": 0, "utilization_pct": 0,
+        }):
+            for _ in range(3):
+                tracer.trace_inference(
+                    model="slate-fast:latest", task_type="test", prompt="p",
+                    result={"response": "OK"}, elapsed=0.1,
+                )
+
+        # Only the first trace falls outside the save interval
+        assert json.loads(metrics_file.read_text())["total_traces"] == 1
+        tracer.flush_metrics()
+        assert json.loads(metrics_file.read_text())["total_traces"] == 3
+
     def test_get_metrics(self):
         tracer = SlateAITracer(enable_otel=False)
         tracer.model_metrics["test-model"] = ModelMetrics(model="test-model")